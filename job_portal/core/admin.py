@@ -24,4 +24,5 @@ admin.site.register(Report)
 admin.site.register(ReportResponse)
 admin.site.register(StaticPage)
 admin.site.register(ContactMessage)
-admin.site.register(SearchLog)
\ No newline at end of file
+admin.site.register(SearchLog)
+admin.site.register(Task)
\ No newline at end of file
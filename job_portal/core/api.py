@@ -0,0 +1,140 @@
+import hashlib
+import json
+from functools import wraps
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.utils import timezone
+from django.views.decorators.http import condition, require_safe
+
+from .catalog import catalog_version
+from .facets import apply_facet_filters, get_facet_filters
+from .models import Job
+from .pagination import keyset_page
+from .search import get_search_backend
+from .skills import parse_skills
+
+API_PAGE_SIZE = 50
+
+LIST_FIELDS = (
+    'id', 'title', 'location', 'job_type', 'salary_min', 'salary_max',
+    'skills_required', 'created_at', 'updated_at', 'expiry_date',
+)
+
+
+def api_login_required(view):
+    """Like login_required, but answers API clients with a JSON 401 instead of a redirect."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return json_response({'error': 'Authentication required.'}, status=401)
+        return view(request, *args, **kwargs)
+    return wrapper
+
+
+def json_response(data, status=200):
+    # Compact separators: no whitespace in the payload.
+    return HttpResponse(
+        json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')),
+        content_type='application/json',
+        status=status,
+    )
+
+
+def serialize_job(row):
+    row = dict(row)
+    row['company'] = row.pop('employer__company_name')
+    row['skills'] = parse_skills(row.pop('skills_required'))
+    row.pop('search_rank', None)
+    return row
+
+
+def catalog_state(request):
+    """
+    (catalog version, last modified), memoized per request.
+
+    The version changes with every job and employer profile write (see
+    core.catalog). The one exception is jobs passing their expiry date, which
+    drop out of listings at midnight without a write, so last_modified is
+    never earlier than the start of today.
+    """
+    if not hasattr(request, '_job_catalog_state'):
+        version, updated_at = catalog_version()
+        start_of_day = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        request._job_catalog_state = (version, max(updated_at or start_of_day, start_of_day))
+    return request._job_catalog_state
+
+
+def listing_etag(request, *args, **kwargs):
+    version, last_modified = catalog_state(request)
+    key = f"{request.path}?{request.GET.urlencode()}:{version}:{last_modified.isoformat()}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def listing_last_modified(request, *args, **kwargs):
+    return catalog_state(request)[1]
+
+
+def job_state(request, job_id):
+    """
+    When the job or its employer's profile last changed, or None if the job
+    isn't live. The detail shows the company name, so both count.
+    """
+    if not hasattr(request, '_job_state'):
+        row = Job.objects.live().filter(id=job_id).values_list('updated_at', 'employer__updated_at').first()
+        request._job_state = max(row) if row else None
+    return request._job_state
+
+
+def job_etag(request, job_id):
+    updated_at = job_state(request, job_id)
+    return f"job-{job_id}-{updated_at.timestamp()}" if updated_at else None
+
+
+def job_last_modified(request, job_id):
+    return job_state(request, job_id)
+
+
+def job_page(request, jobs, ordering):
+    jobs = apply_facet_filters(jobs, get_facet_filters(request.GET))
+    extra = [name.lstrip('-') for name in ordering if name.lstrip('-') not in LIST_FIELDS]
+    page = keyset_page(
+        jobs.values(*LIST_FIELDS, *extra, 'employer__company_name'),
+        ordering,
+        cursor=request.GET.get('cursor'),
+        page_size=API_PAGE_SIZE,
+    )
+    return json_response({
+        'results': [serialize_job(row) for row in page],
+        'next_cursor': page.next_cursor,
+    })
+
+
+@api_login_required
+@require_safe
+@condition(etag_func=listing_etag, last_modified_func=listing_last_modified)
+def api_job_list(request):
+    return job_page(request, Job.objects.live(), ('-created_at', '-id'))
+
+
+@api_login_required
+@require_safe
+@condition(etag_func=listing_etag, last_modified_func=listing_last_modified)
+def api_job_search(request):
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return json_response({'error': "The 'q' parameter is required."}, status=400)
+    jobs = get_search_backend().search(Job.objects.live(), query)
+    return job_page(request, jobs, ('-search_rank', '-id'))
+
+
+@api_login_required
+@require_safe
+@condition(etag_func=job_etag, last_modified_func=job_last_modified)
+def api_job_detail(request, job_id):
+    row = Job.objects.live().filter(id=job_id).values(
+        *LIST_FIELDS, 'description', 'employer__company_name',
+    ).first()
+    if row is None:
+        return json_response({'error': 'Job not found.'}, status=404)
+    return json_response(serialize_job(row))
@@ -0,0 +1,137 @@
+"""
+Async variants of the busiest read-only pages, for running under an ASGI server
+(e.g. ``uvicorn job_portal.asgi:application``).
+
+The sync views issue their independent queries one after another. Here they
+are started together and awaited with asyncio.gather, so a page costs roughly
+its slowest query instead of the sum of all of them.
+"""
+import asyncio
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseForbidden, StreamingHttpResponse
+from django.shortcuts import redirect, render
+
+from .concurrency import in_worker_thread, query_pool
+from .events import get_broker, user_channel
+from .facets import apply_facet_filters, get_facet_counts
+from .models import Application, Job, SavedJob
+from .pagination import keyset_page
+from .recommendations import top_recommendations
+from .views import _job_list_context, _job_listing
+
+STREAM_HEARTBEAT = 15  # seconds between keep-alive comments
+STREAM_MAX_AGE = 300  # seconds before a stream is closed and the browser reconnects
+STREAM_RETRY = 3000  # milliseconds the browser waits before reconnecting
+
+
+def async_login_required(view):
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        # Resolving request.user hits the session and user tables, so it has to
+        # happen off the event loop; afterwards the lazy object is cached.
+        is_authenticated = await sync_to_async(lambda: request.user.is_authenticated)()
+        if not is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+async def gather_queries(*funcs):
+    """
+    Run independent, read-only ORM callables concurrently and return their results.
+
+    Django's async ORM methods all go through one thread-sensitive executor, so
+    awaiting several of them still runs their SQL one query at a time. Each
+    callable here runs on a thread of the shared query pool, which keeps its
+    database connection between requests (see core.concurrency).
+    """
+    return await asyncio.gather(*(
+        sync_to_async(in_worker_thread(func), thread_sensitive=False, executor=query_pool())()
+        for func in funcs
+    ))
+
+
+@async_login_required
+async def job_list_async(request):
+    jobs, ordering, filters = _job_listing(request)
+    user = request.user
+
+    queries = [
+        lambda: get_facet_counts(jobs, filters),
+        lambda: keyset_page(apply_facet_filters(jobs, filters), ordering, cursor=request.GET.get('cursor')),
+    ]
+    if user.role == 'seeker':
+        queries += [
+            lambda: set(Application.objects.filter(seeker__user=user).values_list('job_id', flat=True)),
+            lambda: set(SavedJob.objects.filter(seeker__user=user).values_list('job_id', flat=True)),
+        ]
+    facet_counts, page, *seeker_ids = await gather_queries(*queries)
+    applied_ids, saved_job_ids = seeker_ids or (set(), set())
+
+    context = _job_list_context(request, page, facet_counts, filters, applied_ids, saved_job_ids)
+    return await sync_to_async(render)(request, 'core/job_list.html', context)
+
+
+@async_login_required
+async def seeker_dashboard_async(request):
+    user = request.user
+    if user.role != 'seeker':
+        return redirect('dashboard')
+
+    seeker = await sync_to_async(lambda: user.jobseekerprofile)()
+    recommended, all_jobs, applied_ids, saved_jobs = await gather_queries(
+        lambda: top_recommendations(seeker),
+        lambda: list(Job.objects.live().order_by('-created_at')[:5]),
+        lambda: set(Application.objects.filter(seeker=seeker).values_list('job_id', flat=True)),
+        lambda: list(SavedJob.objects.filter(seeker=seeker).select_related('job')),
+    )
+
+    return await sync_to_async(render)(request, 'core/seeker_dashboard.html', {
+        'recommended_jobs': recommended,
+        'all_jobs': all_jobs,
+        'applied_ids': applied_ids,
+        'saved_jobs': saved_jobs,
+        'saved_job_ids': {item.job_id for item in saved_jobs},
+    })
+
+
+async def _status_events(channel):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + STREAM_MAX_AGE
+    async with get_broker().subscribe(channel) as queue:
+        yield f'retry: {STREAM_RETRY}\n\n'
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=min(STREAM_HEARTBEAT, remaining))
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'
+                continue
+            yield f'event: application-status\ndata: {json.dumps(event)}\n\n'
+
+
+@async_login_required
+async def application_status_stream(request):
+    """
+    Server-Sent Events stream of status changes to the seeker's applications.
+
+    An idle connection is one suspended coroutine and a small queue, so an ASGI
+    worker can hold thousands of them. Streams are closed after STREAM_MAX_AGE so
+    that connections a disconnected client left behind are released; EventSource
+    reconnects on its own.
+    """
+    if request.user.role != 'seeker':
+        return HttpResponseForbidden()
+    if not isinstance(request, ASGIRequest):
+        # A WSGI server would buffer the whole stream and tie up a worker thread
+        # doing it. 204 tells EventSource not to reconnect.
+        return HttpResponse(status=204)
+
+    response = StreamingHttpResponse(_status_events(user_channel(request.user.pk)), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
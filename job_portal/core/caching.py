@@ -0,0 +1,16 @@
+"""
+Whether the configured cache is one store for every process of a deployment.
+
+Explicit invalidation only reaches other processes through a shared backend
+(Redis, Memcached, the database); with one of these each process keeps its own
+copy and only the process that handled a write forgets the old value.
+"""
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
+
+
+def cache_is_shared(alias='default'):
+    return not isinstance(caches[alias], PROCESS_LOCAL_CACHES)
@@ -0,0 +1,32 @@
+"""
+A version number for everything the job listings show.
+
+Jobs and employer profiles are saved and deleted from many places, and a
+listing can change through any of them; counting and scanning both tables on
+every conditional GET would cost as much as serving the page. Instead the
+signals (and the bulk paths that skip them) bump one row after their
+transaction commits, and the listing validators read just that row.
+"""
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import CatalogVersion
+
+CATALOG_ID = 1
+
+
+def _bump():
+    if not CatalogVersion.objects.filter(pk=CATALOG_ID).update(version=F('version') + 1, updated_at=timezone.now()):
+        CatalogVersion.objects.get_or_create(pk=CATALOG_ID, defaults={'version': 1})
+
+
+def bump_catalog_version():
+    """Mark the listings as changed once the current transaction commits."""
+    transaction.on_commit(_bump)
+
+
+def catalog_version():
+    """(version, when it last changed), or (0, None) before anything has been bumped."""
+    row = CatalogVersion.objects.filter(pk=CATALOG_ID).values_list('version', 'updated_at').first()
+    return row or (0, None)
@@ -0,0 +1,58 @@
+"""
+Running ORM code on threads other than the request's.
+
+Django gives every thread database connections of its own. Opening one per
+call would cost a connect (a network round trip plus authentication on a
+networked database) for every query that runs concurrently, and churn
+connections under load. query_pool() is instead a small, bounded set of
+long-lived threads that keep their connections between calls: the process
+holds at most QUERY_POOL_SIZE of them on top of its request threads.
+
+CONN_MAX_AGE doesn't apply to the pool. Django advises against persistent
+connections in async mode because ASGI request threads come and go; the pool's
+threads don't, so keeping their connections is safe.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.db import connections
+
+
+def _drop_broken_connections():
+    # The checks Django runs on a request thread's connections between requests, minus CONN_MAX_AGE.
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is None:
+            continue
+        if connection.get_autocommit() != connection.settings_dict['AUTOCOMMIT']:
+            connection.close()
+        elif connection.errors_occurred:
+            if connection.is_usable():
+                connection.errors_occurred = False
+            else:
+                connection.close()
+
+
+def in_worker_thread(func, keep_connections=True):
+    """
+    Wrap ``func`` for running on a worker thread.
+
+    With ``keep_connections`` the thread's connections stay open for its next
+    call unless they broke. Otherwise they are closed afterwards, for threads
+    that are about to go away.
+    """
+    @wraps(func)
+    def run(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if keep_connections:
+                _drop_broken_connections()
+            else:
+                connections.close_all()
+    return run
+
+
+@lru_cache(maxsize=None)
+def query_pool():
+    return ThreadPoolExecutor(getattr(settings, 'QUERY_POOL_SIZE', 4), thread_name_prefix='query-pool')
@@ -0,0 +1,92 @@
+from collections import Counter
+
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import Application, Job
+
+STATUSES = [status for status, label in Application._meta.get_field('status').choices]
+
+
+def status_field(status):
+    return f'{status}_count'
+
+
+def adjusted(field, delta):
+    """
+    ``field`` moved by ``delta``, never below zero.
+
+    A counter that has drifted low must not make deletes and status changes
+    fail on the column's CHECK constraint; reconcile_job_counters() repairs it.
+    """
+    if delta < 0:
+        return Greatest(F(field) + delta, Value(0))
+    return F(field) + delta
+
+
+def application_created(application):
+    Job.objects.filter(pk=application.job_id).update(**{
+        'application_count': F('application_count') + 1,
+        status_field(application.status): F(status_field(application.status)) + 1,
+    })
+
+
+def application_deleted(application):
+    Job.objects.filter(pk=application.job_id).update(**{
+        'application_count': adjusted('application_count', -1),
+        status_field(application.status): adjusted(status_field(application.status), -1),
+    })
+
+
+def applications_status_changed(job_id, old_statuses, new_status):
+    """
+    Move applications of one job between status counters in a single UPDATE.
+
+    ``old_statuses`` maps each previous status to how many applications left it.
+    """
+    changes = Counter()
+    for old_status, count in old_statuses.items():
+        if old_status != new_status:
+            changes[old_status] -= count
+            changes[new_status] += count
+
+    updates = {
+        status_field(status): adjusted(status_field(status), delta) for status, delta in changes.items() if delta
+    }
+    if updates:
+        Job.objects.filter(pk=job_id).update(**updates)
+
+
+def actual_counts():
+    """Subquery expressions that count a job's applications from scratch."""
+    def count(condition=Q()):
+        counts = (
+            Application.objects.filter(condition, job=OuterRef('pk'))
+            .order_by()
+            .values('job')
+            .annotate(n=Count('id'))
+            .values('n')
+        )
+        return Coalesce(Subquery(counts), Value(0))
+
+    counts = {'application_count': count()}
+    for status in STATUSES:
+        counts[status_field(status)] = count(Q(status=status))
+    return counts
+
+
+def reconcile_job_counters(jobs):
+    """Rewrite the counters of ``jobs`` that have drifted and return how many were fixed."""
+    counts = actual_counts()
+    drifted = Q()
+    for field, expression in counts.items():
+        drifted |= ~Q(**{field: F(f'actual_{field}')})
+
+    drifted_ids = list(
+        jobs.annotate(**{f'actual_{field}': expression for field, expression in counts.items()})
+        .filter(drifted)
+        .values_list('id', flat=True)
+    )
+    if drifted_ids:
+        Job.objects.filter(id__in=drifted_ids).update(**counts)
+    return len(drifted_ids)
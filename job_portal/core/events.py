@@ -0,0 +1,105 @@
+"""
+Publish/subscribe for pushing live events to connected clients.
+
+Publishers are ordinary (sync) code; subscribers are async stream views. The
+default InProcessBroker only reaches subscribers in the same process, which is
+enough for a single ASGI worker. Point EVENT_BROKER at another BaseBroker
+subclass (e.g. one backed by Redis pub/sub) to fan out across processes.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class BaseBroker:
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    def subscribe(self, channel):
+        """Async context manager yielding an asyncio.Queue that receives the channel's messages."""
+        raise NotImplementedError
+
+
+class InProcessBroker(BaseBroker):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, message)
+            except RuntimeError:
+                # The subscriber's event loop has shut down.
+                pass
+
+    @staticmethod
+    def _deliver(queue, message):
+        # A client that stopped reading loses old messages rather than growing memory.
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(subscriber)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    path = getattr(settings, 'EVENT_BROKER', None)
+    return import_string(path)() if path else InProcessBroker()
+
+
+def user_channel(user_id):
+    return f'user:{user_id}'
+
+
+def publish_to_user(user_id, message):
+    """Publish ``message`` to the user's channel once the current transaction commits."""
+    transaction.on_commit(lambda: get_broker().publish(user_channel(user_id), message))
+
+
+def _status_message(application, job):
+    return {
+        'application_id': application.pk,
+        'job_id': job.pk,
+        'job_title': job.title,
+        'status': application.status,
+        'status_display': application.get_status_display(),
+    }
+
+
+def publish_status_change(application, job):
+    publish_to_user(application.seeker.user_id, _status_message(application, job))
+
+
+def publish_status_changes(applications, job):
+    """publish_status_change() for many applications of ``job``, with one on_commit hook for all of them."""
+    messages = [(user_channel(application.seeker.user_id), _status_message(application, job)) for application in applications]
+
+    def publish():
+        broker = get_broker()
+        for channel, message in messages:
+            broker.publish(channel, message)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .catalog import bump_catalog_version
+from .models import Job, JobRecommendation
+from .recommendations import refill
+
+EXPIRE_BATCH_SIZE = 500
+
+
+def expire_jobs(batch_size=EXPIRE_BATCH_SIZE):
+    """
+    Deactivate active jobs whose expiry date has passed and return how many were.
+
+    Jobs are picked off the (is_active, expiry_date) index and updated
+    ``batch_size`` at a time, each batch in its own short transaction. Their
+    stored recommendations go with them, and the lists they leave are refilled.
+    """
+    expired = Job.objects.filter(is_active=True, expiry_date__lt=timezone.localdate()).order_by('expiry_date', 'id')
+    total = 0
+    while True:
+        ids = list(expired.values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return total
+        with transaction.atomic():
+            # update() skips auto_now, and the API's ETags are built from updated_at.
+            total += Job.objects.filter(id__in=ids, is_active=True).update(is_active=False, updated_at=timezone.now())
+            bump_catalog_version()
+            recommendations = JobRecommendation.objects.filter(job_id__in=ids)
+            seeker_ids = set(recommendations.values_list('seeker_id', flat=True))
+            recommendations.delete()
+        # Outside the batch's transaction, which stays short.
+        refill(seeker_ids)
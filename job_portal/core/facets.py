@@ -0,0 +1,99 @@
+from collections import Counter
+
+from django.db.models import Case, CharField, Count, Q, Value, When
+
+from .models import Job
+
+# Salary ranges are bucketed on Job.salary_max: (key, label, lower bound, upper bound).
+SALARY_RANGES = [
+    ('0-50k', 'Up to 50k', None, 50000),
+    ('50k-100k', '50k - 100k', 50000, 100000),
+    ('100k-150k', '100k - 150k', 100000, 150000),
+    ('150k+', '150k+', 150000, None),
+]
+
+FACETS = ('job_type', 'location', 'salary')
+
+LOCATION_FACET_LIMIT = 10
+
+
+def salary_range_q(key):
+    for range_key, label, low, high in SALARY_RANGES:
+        if range_key == key:
+            q = Q()
+            if low is not None:
+                q &= Q(salary_max__gte=low)
+            if high is not None:
+                q &= Q(salary_max__lt=high)
+            return q
+    return None
+
+
+def salary_range_expression():
+    return Case(
+        *[When(salary_range_q(key), then=Value(key)) for key, label, low, high in SALARY_RANGES],
+        output_field=CharField(),
+    )
+
+
+def get_facet_filters(params):
+    """Read the valid facet selections out of a GET QueryDict."""
+    filters = {}
+    job_type = params.get('job_type')
+    if job_type in dict(Job._meta.get_field('job_type').choices):
+        filters['job_type'] = job_type
+    location = params.get('location')
+    if location:
+        filters['location'] = location
+    salary = params.get('salary')
+    if salary_range_q(salary) is not None:
+        filters['salary'] = salary
+    return filters
+
+
+def facet_q(facet, value):
+    if facet == 'salary':
+        return salary_range_q(value)
+    return Q(**{facet: value})
+
+
+def apply_facet_filters(queryset, filters):
+    for facet, value in filters.items():
+        queryset = queryset.filter(facet_q(facet, value))
+    return queryset
+
+
+def get_facet_counts(queryset, filters):
+    """
+    Count jobs per job type, location and salary range with one GROUP BY query.
+
+    The query returns the job_type x location x salary cross tab of the
+    unfiltered set, and each facet is rolled up from it with the *other*
+    facets' selections applied. Picking a job type therefore narrows the
+    location counts, but still shows how many jobs the other types have.
+    """
+    rows = (
+        queryset.order_by()
+        .annotate(salary=salary_range_expression())
+        .values('job_type', 'location', 'salary')
+        .annotate(count=Count('id'))
+    )
+
+    counts = {facet: Counter() for facet in FACETS}
+    for row in rows:
+        for facet in FACETS:
+            if all(row[other] == value for other, value in filters.items() if other != facet):
+                counts[facet][row[facet]] += row['count']
+
+    locations = [location for location, count in counts['location'].most_common(LOCATION_FACET_LIMIT)]
+    if filters.get('location') and filters['location'] not in locations:
+        locations.append(filters['location'])
+
+    return {
+        'job_type': [
+            (value, label, counts['job_type'][value])
+            for value, label in Job._meta.get_field('job_type').choices
+        ],
+        'location': [(value, value, counts['location'][value]) for value in locations],
+        'salary': [(key, label, counts['salary'][key]) for key, label, low, high in SALARY_RANGES],
+    }
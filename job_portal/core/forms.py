@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm,AuthenticationForm
 from .models import *
+from .recommendations import refresh_for_seeker
+from .skills import parse_skills, sync_profile_skills
 
 class UserRegisterForm(UserCreationForm):
     class Meta:
@@ -38,16 +40,10 @@ class JobSeekerProfileForm(forms.ModelForm):
         if commit:
             instance.save()
 
-            # Handle skill creation
-            raw_skills = self.cleaned_data.get('skill_input', '')
-            skill_names = [s.strip().lower() for s in raw_skills.split(',') if s.strip()]
-
-            # Remove old skills
-            instance.skills.clear()
-
-            for name in skill_names:
-                skill_obj, created = Skill.objects.get_or_create(name=name)
-                instance.skills.add(skill_obj)
+            # Only the skills that were added or removed are written
+            skill_names = parse_skills(self.cleaned_data.get('skill_input', ''))
+            if sync_profile_skills(instance, skill_names):
+                refresh_for_seeker(instance)
 
         return instance
         
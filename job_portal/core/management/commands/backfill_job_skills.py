@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Job, JobSkill
+from core.skills import ensure_skills, parse_skills
+
+
+class Command(BaseCommand):
+    help = "Rebuild the normalized JobSkill rows of existing jobs in resumable batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--start-after', type=int, default=0,
+            help="Skip jobs with an id up to and including this one (resume point of a previous run).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = options['start_after']
+        total = 0
+
+        while True:
+            batch = list(
+                Job.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'skills_required')[:batch_size]
+            )
+            if not batch:
+                break
+
+            with transaction.atomic():
+                self.backfill(batch)
+
+            last_id = batch[-1][0]
+            total += len(batch)
+            self.stdout.write(f"Backfilled {total} jobs (resume with --start-after {last_id})")
+
+        self.stdout.write(self.style.SUCCESS(f"Done. {total} jobs backfilled."))
+
+    def backfill(self, batch):
+        job_skills = {job_id: parse_skills(raw) for job_id, raw in batch}
+        skill_ids = ensure_skills(name for names in job_skills.values() for name in names)
+
+        JobSkill.objects.filter(job_id__in=job_skills).delete()
+        JobSkill.objects.bulk_create([
+            JobSkill(job_id=job_id, skill_id=skill_ids[name], skill_name=name)
+            for job_id, names in job_skills.items()
+            for name in names
+        ])
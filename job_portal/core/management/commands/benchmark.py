@@ -0,0 +1,186 @@
+import json
+import math
+import random
+import statistics
+import time
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries
+from django.test import AsyncClient, Client
+from django.test.utils import (
+    CaptureQueriesContext, override_settings, setup_test_environment, teardown_test_environment,
+)
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import EmployerProfile, Job, JobSeekerProfile
+from core.nplusone import detect_n_plus_one
+from core.seeding import check_scale, seed_portal
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)]
+
+
+def summarize(timings, query_counts):
+    timings = sorted(timings)
+    summary = {'requests': len(timings)}
+    for p in PERCENTILES:
+        summary[f'p{p}_ms'] = round(percentile(timings, p) * 1000, 2)
+    summary['mean_ms'] = round(statistics.mean(timings) * 1000, 2)
+    summary['max_ms'] = round(timings[-1] * 1000, 2)
+    summary['queries_median'] = statistics.median(query_counts)
+    summary['queries_max'] = max(query_counts)
+    return summary
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database with synthetic data, drive the core views through the test "
+        "client and report latency percentiles and query counts as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employers', type=int, default=200)
+        parser.add_argument('--seekers', type=int, default=5000)
+        parser.add_argument('--jobs', type=int, default=2500)
+        parser.add_argument('--applications', type=int, default=25000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--requests', type=int, default=50, help="Measured requests per view.")
+        parser.add_argument('--warmup', type=int, default=3, help="Unmeasured requests per view before measuring.")
+        parser.add_argument('--output', help="Write the results to this JSON file instead of stdout.")
+        parser.add_argument('--compare', help="A previous results file to print the differences against.")
+
+    def handle(self, *args, **options):
+        try:
+            check_scale(**{name: options[name] for name in ('employers', 'seekers', 'jobs', 'applications')})
+        except ValueError as e:
+            raise CommandError(e)
+
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(e)
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            # Measure the views themselves, not the development instrumentation.
+            with override_settings(METRICS_ENABLED=False, NPLUSONE_ENABLED=False, TASK_QUEUE_EAGER=False):
+                results = self.run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(f"Results written to {options['output']}.")
+        else:
+            self.stdout.write(output)
+        if baseline:
+            self.print_comparison(baseline, results)
+
+    def run(self, options):
+        scale = {name: options[name] for name in ('employers', 'seekers', 'jobs', 'applications')}
+        started = time.perf_counter()
+        seed_portal(**scale, seed=options['seed'], log=self.stderr.write)
+        seed_seconds = time.perf_counter() - started
+
+        rng = random.Random(options['seed'])
+        seekers = list(JobSeekerProfile.objects.select_related('user').order_by('id'))
+        employers = list(EmployerProfile.objects.select_related('user').order_by('id'))
+        live_job_ids = list(Job.objects.live().values_list('id', flat=True))
+        # The busiest jobs, where view_applicants has the most rows to render.
+        busy_jobs = list(Job.objects.select_related('employer__user').order_by('-application_count')[:20])
+
+        def seeker_get(url):
+            return lambda: (rng.choice(seekers).user, 'get', url, None)
+
+        def employer_get(url):
+            return lambda: (rng.choice(employers).user, 'get', url, None)
+
+        def applicants():
+            job = rng.choice(busy_jobs)
+            return job.employer.user, 'get', reverse('view-applicants', args=[job.id]), None
+
+        def apply():
+            url = reverse('apply-job', args=[rng.choice(live_job_ids)])
+            return rng.choice(seekers).user, 'post', url, {'cover_letter': 'Benchmark application.'}
+
+        scenarios = {
+            'job_list': seeker_get(reverse('job-list')),
+            'job_list_search': seeker_get(reverse('job-list') + '?q=python'),
+            'seeker_dashboard': seeker_get(reverse('seeker-dashboard')),
+            'employer_dashboard': employer_get(reverse('employer-dashboard')),
+            'view_applicants': applicants,
+            'apply_job': apply,
+            # Through the ASGI handler; their queries run on the query pool's threads.
+            'job_list_async': seeker_get(reverse('job-list-async')),
+            'seeker_dashboard_async': seeker_get(reverse('seeker-dashboard-async')),
+        }
+
+        client, async_client = Client(), AsyncClient()
+        views = {}
+        for name, next_request in scenarios.items():
+            timings, query_counts = [], []
+            for i in range(options['warmup'] + options['requests']):
+                user, method, url, data = next_request()
+                if name.endswith('_async'):
+                    async_client.force_login(user)
+                    # CaptureQueriesContext only sees this thread's connection; the QueryLog sees every thread.
+                    with detect_n_plus_one(raise_error=False) as query_log:
+                        start = time.perf_counter()
+                        response = async_to_sync(self.async_request)(async_client, method, url, data)
+                        elapsed = time.perf_counter() - start
+                    query_count = sum(query_log.counts.values())
+                else:
+                    client.force_login(user)
+                    # CaptureQueriesContext counts by the length of the query log, which stops growing at 9000.
+                    reset_queries()
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        response = getattr(client, method)(url, data)
+                        elapsed = time.perf_counter() - start
+                    query_count = len(queries)
+                if response.status_code >= 400:
+                    raise CommandError(f"{name}: {method.upper()} {url} returned {response.status_code}")
+                if i >= options['warmup']:
+                    timings.append(elapsed)
+                    query_counts.append(query_count)
+            views[name] = summarize(timings, query_counts)
+            self.stderr.write(f"{name}: p50 {views[name]['p50_ms']} ms, {views[name]['queries_median']} queries")
+
+        return {
+            'run_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'seed': options['seed'],
+            'scale': scale,
+            'seed_seconds': round(seed_seconds, 2),
+            'views': views,
+        }
+
+    @staticmethod
+    async def async_request(client, method, url, data):
+        return await getattr(client, method)(url, data)
+
+    def print_comparison(self, baseline, results):
+        self.stdout.write(f"\n{'view':<20} {'p50 ms':>18} {'p95 ms':>18} {'queries':>12}")
+        for name, current in results['views'].items():
+            previous = baseline.get('views', {}).get(name)
+            if previous is None:
+                continue
+            columns = []
+            for key in ('p50_ms', 'p95_ms', 'queries_median'):
+                before, after = previous[key], current[key]
+                change = f"{(after - before) / before * 100:+.0f}%" if before else "n/a"
+                columns.append(f"{before}->{after} ({change})")
+            self.stdout.write(f"{name:<20} {columns[0]:>18} {columns[1]:>18} {columns[2]:>12}")
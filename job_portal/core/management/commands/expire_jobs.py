@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from core.expiry import EXPIRE_BATCH_SIZE, expire_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Deactivate jobs past their expiry date. Schedule it daily (e.g. from cron); "
+        "listings already hide expired jobs in the meantime."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=EXPIRE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        expired = expire_jobs(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Deactivated {expired} expired jobs."))
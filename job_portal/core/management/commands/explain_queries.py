@@ -0,0 +1,63 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.models import Application, Job, JobRecommendation, Notification, Payment, SavedJob
+
+# Plan lines that mean a whole table is read. SQLite prints "SCAN <table>" for a
+# full scan and "SCAN <table> USING [COVERING] INDEX ..." when it walks an index.
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (?!.*\bUSING\b)'),
+    'postgresql': re.compile(r'\bSeq Scan\b'),
+    'mysql': re.compile(r'\btype: ALL\b'),
+}
+
+
+def hot_querysets(pk=1):
+    """The querysets behind the busiest views, keyed by a short description."""
+    return {
+        'job list (active, newest first)': Job.objects.live().order_by('-created_at', '-id')[:21],
+        'seeker dashboard latest jobs': Job.objects.live().order_by('-created_at')[:5],
+        'seeker applied job ids': Application.objects.filter(seeker_id=pk).values_list('job_id', flat=True),
+        'seeker saved job ids': SavedJob.objects.filter(seeker_id=pk).values_list('job_id', flat=True),
+        'seeker recommendations': JobRecommendation.objects.filter(seeker_id=pk).order_by('-score')[:5],
+        'duplicate application check': Application.objects.filter(job_id=pk, seeker_id=pk),
+        'expired job sweep': Job.objects.filter(is_active=True, expiry_date__lt='2000-01-01').order_by('expiry_date', 'id')[:500],
+        'employer dashboard jobs': Job.objects.filter(employer_id=pk).order_by('-created_at'),
+        'job applicants page': Application.objects.filter(job_id=pk).select_related('seeker__user').order_by('-applied_at', '-id')[:21],
+        'job applicants by status': Application.objects.filter(job_id=pk, status='applied').order_by('-applied_at', '-id')[:21],
+        'payment history': Payment.objects.filter(employer_id=pk).order_by('-timestamp'),
+        'notification list': Notification.objects.filter(user_id=pk).order_by('-created_at', '-id')[:50],
+        'unread notification count': Notification.objects.filter(user_id=pk, is_read=False),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN over the querysets behind the main views and flag any that read a whole table. "
+        "Planners may prefer a full scan on near-empty tables, so run it against realistic data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--strict', action='store_true', help="Exit with an error if any query does a full scan.")
+
+    def handle(self, *args, **options):
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"Don't know how to read {connection.vendor} query plans.")
+
+        scans = []
+        for name, queryset in hot_querysets().items():
+            plan = queryset.explain()
+            if pattern.search(plan):
+                scans.append(name)
+                self.stdout.write(self.style.WARNING(f"FULL SCAN  {name}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"indexed    {name}"))
+            if options['verbosity'] > 1 or pattern.search(plan):
+                for line in plan.splitlines():
+                    self.stdout.write(f"    {line}")
+
+        if scans and options['strict']:
+            raise CommandError(f"{len(scans)} queries do a full table scan: {', '.join(scans)}")
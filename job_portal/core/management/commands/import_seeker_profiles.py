@@ -0,0 +1,63 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import JobSeekerProfile, User
+from core.skills import ensure_skills, parse_skills, sync_profile_skills
+
+PROFILE_FIELDS = ('phone', 'location', 'bio')
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or update job seeker profiles from a CSV file with the columns "
+        "username, phone, location, bio and skills (comma separated)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['csv_file'], newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+        except OSError as e:
+            raise CommandError(e)
+
+        batch_size = options['batch_size']
+        imported = 0
+        for start in range(0, len(rows), batch_size):
+            imported += self.import_batch(rows[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {imported} of {len(rows)} profiles."))
+        if imported:
+            self.stdout.write("Run `manage.py refresh_recommendations` to update their job recommendations.")
+
+    @transaction.atomic
+    def import_batch(self, rows):
+        users = {
+            user.username: user
+            for user in User.objects.filter(role='seeker', username__in=[row.get('username') for row in rows])
+        }
+        profiles = {profile.user_id: profile for profile in JobSeekerProfile.objects.filter(user__in=users.values())}
+        skills = {row.get('username'): parse_skills(row.get('skills')) for row in rows}
+        # One Skill upsert for the whole batch instead of one per profile.
+        skill_ids = ensure_skills(name for names in skills.values() for name in names)
+
+        imported = 0
+        for row in rows:
+            user = users.get(row.get('username'))
+            if user is None:
+                self.stderr.write(f"Skipping {row.get('username')!r}: no job seeker with that username.")
+                continue
+
+            profile = profiles.get(user.pk) or JobSeekerProfile(user=user)
+            for field in PROFILE_FIELDS:
+                if row.get(field) is not None:
+                    setattr(profile, field, row[field])
+            profile.save()
+            sync_profile_skills(profile, skills[user.username], skill_ids=skill_ids)
+            imported += 1
+        return imported
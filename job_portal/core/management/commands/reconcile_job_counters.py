@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from core.counters import reconcile_job_counters
+from core.models import Job
+
+
+class Command(BaseCommand):
+    help = "Recount the denormalized application counters on Job and repair any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = 0
+        checked = fixed = 0
+
+        while True:
+            ids = list(Job.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            fixed += reconcile_job_counters(Job.objects.filter(id__in=ids))
+            checked += len(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} jobs, repaired {fixed}."))
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import JobRecommendation, JobSeekerProfile
+from core.recommendations import refresh_for_seeker
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored job recommendations of every job seeker."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--engine', choices=['sql', 'sparse'], default='sql',
+            help="'sql' scores one seeker per query; 'sparse' scores everyone with "
+                 "NumPy/SciPy sparse matrix products (for nightly full rebuilds).",
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000, help="Seekers per sparse batch.")
+
+    def handle(self, *args, **options):
+        if options['engine'] == 'sparse':
+            count = self.refresh_sparse(options['chunk_size'])
+        else:
+            count = 0
+            for seeker in JobSeekerProfile.objects.order_by('id').iterator():
+                refresh_for_seeker(seeker)
+                count += 1
+        self.stdout.write(self.style.SUCCESS(f"Refreshed recommendations for {count} seekers."))
+
+    def refresh_sparse(self, chunk_size):
+        try:
+            from core.matching import score_all
+            import numpy, scipy  # noqa: F401
+        except ImportError:
+            raise CommandError("The sparse engine needs NumPy and SciPy: pip install numpy scipy")
+
+        count = 0
+        batch = {}
+        for seeker_id, matches in score_all(chunk_size=chunk_size):
+            batch[seeker_id] = matches
+            count += 1
+            if len(batch) >= chunk_size:
+                self.store(batch)
+                batch = {}
+        self.store(batch)
+        return count
+
+    def store(self, batch):
+        with transaction.atomic():
+            JobRecommendation.objects.filter(seeker_id__in=batch).delete()
+            JobRecommendation.objects.bulk_create(
+                [
+                    JobRecommendation(seeker_id=seeker_id, job_id=job_id, score=score)
+                    for seeker_id, matches in batch.items()
+                    for job_id, score in matches
+                ],
+                batch_size=1000,
+            )
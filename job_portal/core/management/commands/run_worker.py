@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.tasks import claim_tasks, requeue_stale_tasks, run_task
+
+
+class Command(BaseCommand):
+    help = "Process queued background tasks until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Exit once the queue has no due tasks.")
+        parser.add_argument('--batch-size', type=int, default=20)
+        parser.add_argument('--sleep', type=float, default=1.0, help="Seconds to wait when the queue is empty.")
+        parser.add_argument(
+            '--stale-after', type=int, default=600,
+            help="Requeue tasks left running for this many seconds by a crashed worker.",
+        )
+
+    def handle(self, *args, **options):
+        processed = failed = 0
+        try:
+            while True:
+                close_old_connections()
+                requeue_stale_tasks(options['stale_after'])
+                tasks = claim_tasks(options['batch_size'])
+                if not tasks:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+                    continue
+                for task in tasks:
+                    if run_task(task):
+                        processed += 1
+                    else:
+                        failed += 1
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} tasks ({failed} failed attempts)."))
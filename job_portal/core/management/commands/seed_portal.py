@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import User
+from core.seeding import BATCH_SIZE, SEED_PASSWORD, check_scale, max_workers, seed_portal
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with a reproducible synthetic dataset: employers, seekers with skills, jobs, "
+        "applications, saved jobs, payments and reviews."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employers', type=int, default=100)
+        parser.add_argument('--seekers', type=int, default=2000)
+        parser.add_argument('--jobs', type=int, default=1000)
+        parser.add_argument('--applications', type=int, default=10000)
+        parser.add_argument('--saved-jobs', type=int, default=4000)
+        parser.add_argument('--payments', type=int, default=300)
+        parser.add_argument('--reviews', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=0, help="Same seed and counts, same data.")
+        parser.add_argument('--prefix', default='seed', help="Username prefix; pick a new one to add a second dataset.")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--workers', type=int, default=4, help="Writer threads (ignored on SQLite).")
+
+    def handle(self, *args, **options):
+        try:
+            check_scale(**{name: options[name] for name in (
+                'employers', 'seekers', 'jobs', 'applications', 'saved_jobs', 'payments', 'reviews', 'batch_size',
+            )})
+        except ValueError as e:
+            raise CommandError(e)
+
+        prefix = options['prefix']
+        if User.objects.filter(username__startswith=f'{prefix}-').exists():
+            raise CommandError(f"Users with the prefix {prefix!r} already exist; choose another --prefix.")
+
+        workers = max_workers(options['workers'])
+        self.stdout.write(f"Seeding with {workers} writer thread(s).")
+        started = time.perf_counter()
+        seed_portal(
+            employers=options['employers'],
+            seekers=options['seekers'],
+            jobs=options['jobs'],
+            applications=options['applications'],
+            saved_jobs=options['saved_jobs'],
+            payments=options['payments'],
+            reviews=options['reviews'],
+            seed=options['seed'],
+            prefix=prefix,
+            batch_size=options['batch_size'],
+            workers=workers,
+            log=self.stdout.write,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Done in {time.perf_counter() - started:.1f}s. Log in as {prefix}-seeker-0 or {prefix}-employer-0 "
+            f"with the password {SEED_PASSWORD!r}."
+        ))
@@ -0,0 +1,98 @@
+"""
+Batch scoring of every seeker against every active job.
+
+Seekers and jobs are encoded as sparse binary skill vectors, so the number of
+shared skills for a whole block of seekers is one sparse matrix product. Scores
+use the same definition as the dashboard (see recommendations.match_score):
+matched skills / job skills * 100.
+
+Requires NumPy and SciPy, which are only needed for this batch path.
+"""
+from collections import Counter
+
+from .models import Job, JobSeekerProfile, JobSkill
+from .recommendations import TOP_K
+
+SEEKER_CHUNK_SIZE = 2000
+
+
+def load_job_matrix():
+    """
+    Return (job_ids, skill_index, job_matrix, job_skill_totals) for all active jobs.
+
+    ``job_matrix`` is a skills x jobs CSC matrix with a 1 where the job requires
+    the skill; ``skill_index`` maps a Skill id to its row.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    pairs = list(
+        JobSkill.objects.filter(job__in=Job.objects.live(), skill__isnull=False)
+        .values_list('job_id', 'skill_id')
+    )
+    totals = Counter(JobSkill.objects.filter(job__in=Job.objects.live()).values_list('job_id', flat=True).iterator())
+
+    job_ids = sorted({job_id for job_id, skill_id in pairs})
+    job_index = {job_id: i for i, job_id in enumerate(job_ids)}
+    skill_index = {skill_id: i for i, skill_id in enumerate(sorted({skill_id for job_id, skill_id in pairs}))}
+
+    rows = np.fromiter((skill_index[skill_id] for job_id, skill_id in pairs), dtype=np.int32, count=len(pairs))
+    cols = np.fromiter((job_index[job_id] for job_id, skill_id in pairs), dtype=np.int32, count=len(pairs))
+    job_matrix = sparse.csc_matrix(
+        (np.ones(len(pairs), dtype=np.float32), (rows, cols)),
+        shape=(len(skill_index), len(job_ids)),
+    )
+    job_skill_totals = np.array([totals[job_id] for job_id in job_ids], dtype=np.float32)
+    return np.array(job_ids, dtype=np.int64), skill_index, job_matrix, job_skill_totals
+
+
+def seeker_matrix(seeker_ids, skill_index):
+    """Encode ``seeker_ids`` as a seekers x skills CSR matrix over the job skill vocabulary."""
+    import numpy as np
+    from scipy import sparse
+
+    row_of = {seeker_id: i for i, seeker_id in enumerate(seeker_ids)}
+    through = JobSeekerProfile.skills.through
+    rows, cols = [], []
+    for seeker_id, skill_id in through.objects.filter(jobseekerprofile_id__in=seeker_ids).values_list(
+        'jobseekerprofile_id', 'skill_id'
+    ):
+        # Skills no active job asks for can't contribute to any score.
+        if skill_id in skill_index:
+            rows.append(row_of[seeker_id])
+            cols.append(skill_index[skill_id])
+
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+        shape=(len(seeker_ids), len(skill_index)),
+    )
+
+
+def score_all(top_k=TOP_K, chunk_size=SEEKER_CHUNK_SIZE):
+    """
+    Yield (seeker_id, [(job_id, score), ...]) with each seeker's top ``top_k`` jobs.
+
+    Seekers are scored ``chunk_size`` at a time, so memory is bounded by one
+    chunk's match matrix rather than the full seekers x jobs product. Ties are
+    broken towards the newer (higher id) job, like the stored recommendations.
+    """
+    import numpy as np
+
+    job_ids, skill_index, job_matrix, job_skill_totals = load_job_matrix()
+    seeker_ids = list(JobSeekerProfile.objects.order_by('id').values_list('id', flat=True))
+
+    for start in range(0, len(seeker_ids), chunk_size):
+        chunk = seeker_ids[start:start + chunk_size]
+        matched = (seeker_matrix(chunk, skill_index) @ job_matrix).tocsr()
+        matched.sort_indices()
+
+        for row, seeker_id in enumerate(chunk):
+            begin, end = matched.indptr[row], matched.indptr[row + 1]
+            if begin == end:
+                yield seeker_id, []
+                continue
+            cols = matched.indices[begin:end]
+            scores = matched.data[begin:end].astype(np.float64) * 100.0 / job_skill_totals[cols]
+            # lexsort sorts by the last key first: score descending, then job id descending.
+            order = np.lexsort((-job_ids[cols], -scores))[:top_k]
+            yield seeker_id, [(int(job_ids[cols[i]]), float(scores[i])) for i in order]
@@ -0,0 +1,150 @@
+"""
+Per-view request metrics, kept in memory and exported in Prometheus text format.
+
+MetricsMiddleware (core.middleware) samples requests and records, per view:
+wall time, number of queries, time spent in the database, template render
+time and response size. Histograms live in this process only; with several
+workers, scrape each of them.
+"""
+import threading
+import time
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import Template as DjangoTemplate
+
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series = {}  # view -> [bucket counts..., sum, count]
+
+    def observe(self, view, value):
+        with self._lock:
+            series = self._series.get(view)
+            if series is None:
+                series = self._series[view] = [0] * len(self.buckets) + [0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {view: list(values) for view, values in self._series.items()}
+        for view, values in sorted(series.items()):
+            label = view.replace('\\', '\\\\').replace('"', '\\"')
+            for bound, count in zip(self.buckets, values):
+                lines.append(f'{self.name}_bucket{{view="{label}",le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{view="{label}",le="+Inf"}} {values[-1]}')
+            lines.append(f'{self.name}_sum{{view="{label}"}} {values[-2]}')
+            lines.append(f'{self.name}_count{{view="{label}"}} {values[-1]}')
+        return '\n'.join(lines)
+
+
+REQUEST_DURATION = Histogram('job_portal_request_duration_seconds', "Time spent handling the request.", TIME_BUCKETS)
+REQUEST_QUERIES = Histogram('job_portal_request_queries', "Database queries issued by the request.", QUERY_BUCKETS)
+REQUEST_DB_TIME = Histogram('job_portal_request_db_seconds', "Time spent waiting on the database.", TIME_BUCKETS)
+TEMPLATE_RENDER_TIME = Histogram('job_portal_template_render_seconds', "Time spent rendering templates.", TIME_BUCKETS)
+RESPONSE_SIZE = Histogram('job_portal_response_size_bytes', "Size of the response body.", SIZE_BUCKETS)
+
+HISTOGRAMS = (REQUEST_DURATION, REQUEST_QUERIES, REQUEST_DB_TIME, TEMPLATE_RENDER_TIME, RESPONSE_SIZE)
+
+
+class RequestSample:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    def add_query(self, duration):
+        # Async views run queries from several threads at once.
+        with self._lock:
+            self.queries += 1
+            self.db_time += duration
+
+    def add_render(self, duration):
+        with self._lock:
+            self.template_time += duration
+
+    def record(self, request, response):
+        match = request.resolver_match
+        view = match.view_name if match else 'unresolved'
+        REQUEST_DURATION.observe(view, time.perf_counter() - self.started)
+        REQUEST_QUERIES.observe(view, self.queries)
+        REQUEST_DB_TIME.observe(view, self.db_time)
+        TEMPLATE_RENDER_TIME.observe(view, self.template_time)
+        if not response.streaming:
+            RESPONSE_SIZE.observe(view, len(response.content))
+
+
+# The sample of the request being handled; sync_to_async copies it into worker threads.
+current_sample = ContextVar('current_sample', default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    sample = current_sample.get()
+    if sample is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        sample.add_query(time.perf_counter() - start)
+
+
+def _instrument_connection(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        # Outermost, so a temporary connection.execute_wrapper() block pops its own wrapper, not ours.
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+def _timed_render(render):
+    def wrapper(self, context=None, request=None):
+        sample = current_sample.get()
+        if sample is None:
+            return render(self, context, request)
+        start = time.perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            sample.add_render(time.perf_counter() - start)
+    return wrapper
+
+
+_installed = False
+
+
+def install():
+    """Hook query and template timing into Django. Only called when metrics are enabled."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    connection_created.connect(_instrument_connection)
+    instrument_current_connections()
+    # Only top-level renders (render(), render_to_string()) go through the
+    # backend template, so {% include %}s aren't counted twice.
+    DjangoTemplate.render = _timed_render(DjangoTemplate.render)
+
+
+def instrument_current_connections():
+    """Instrument this thread's connections; ones opened before install() never saw the signal."""
+    for connection in connections.all(initialized_only=True):
+        _instrument_connection(connection)
+
+
+def exposition():
+    return '\n'.join(histogram.expose() for histogram in HISTOGRAMS) + '\n'
@@ -0,0 +1,102 @@
+import random
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from . import metrics
+from .nplusone import DEFAULT_THRESHOLD, NPlusOneError, detect_n_plus_one, logger as nplusone_logger
+
+
+class MetricsMiddleware:
+    """
+    Record per-view metrics (see core.metrics) for a METRICS_SAMPLE_RATE share of requests.
+
+    With METRICS_ENABLED off, Django drops the middleware at startup and nothing
+    is hooked into the database or template layers.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'METRICS_SAMPLE_RATE', 1.0)
+        metrics.install()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _start(self):
+        if random.random() >= self.sample_rate:
+            return None, None
+        metrics.instrument_current_connections()
+        sample = metrics.RequestSample()
+        return sample, metrics.current_sample.set(sample)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        sample, token = self._start()
+        if sample is None:
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.current_sample.reset(token)
+        sample.record(request, response)
+        return response
+
+    async def __acall__(self, request):
+        sample, token = self._start()
+        if sample is None:
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.current_sample.reset(token)
+        sample.record(request, response)
+        return response
+
+
+class NPlusOneMiddleware:
+    """
+    Report query shapes repeated within one request (see core.nplusone).
+
+    Enabled by NPLUSONE_ENABLED. Findings are logged, or raised as NPlusOneError
+    when NPLUSONE_RAISE is set, e.g. for test runs.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'NPLUSONE_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _check(self, request, query_log):
+        match = request.resolver_match
+        report = query_log.report(match.view_name if match else None)
+        if not report:
+            return
+        if getattr(settings, 'NPLUSONE_RAISE', False):
+            raise NPlusOneError(report)
+        nplusone_logger.warning(report)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        threshold = getattr(settings, 'NPLUSONE_THRESHOLD', DEFAULT_THRESHOLD)
+        with detect_n_plus_one(threshold, raise_error=False) as query_log:
+            response = self.get_response(request)
+        self._check(request, query_log)
+        return response
+
+    async def __acall__(self, request):
+        threshold = getattr(settings, 'NPLUSONE_THRESHOLD', DEFAULT_THRESHOLD)
+        with detect_n_plus_one(threshold, raise_error=False) as query_log:
+            response = await self.get_response(request)
+        self._check(request, query_log)
+        return response
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_rename_payments_payment"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="jobskill",
+            name="skill_name",
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+    ]
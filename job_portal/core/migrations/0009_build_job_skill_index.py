@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+def build_job_skill_index(apps, schema_editor):
+    Job = apps.get_model("core", "Job")
+    JobSkill = apps.get_model("core", "JobSkill")
+
+    JobSkill.objects.all().delete()
+    rows = []
+    for job_id, raw in Job.objects.values_list("id", "skills_required").iterator():
+        names = {s.strip().lower()[:50] for s in (raw or "").split(",")}
+        rows.extend(JobSkill(job_id=job_id, skill_name=name) for name in names if name)
+    JobSkill.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    # Kept apart from the schema changes around it: on PostgreSQL, altering a
+    # table in the transaction that inserted rows with deferred FK checks fails.
+    # The unique constraint (0010) comes after, so old duplicate rows are gone.
+
+    dependencies = [
+        ("core", "0008_jobskill_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(build_job_skill_index, migrations.RunPython.noop),
+    ]
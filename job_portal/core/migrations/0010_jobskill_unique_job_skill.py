@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_build_job_skill_index"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="jobskill",
+            unique_together={("job", "skill_name")},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_jobskill_unique_job_skill"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobskill",
+            name="skill",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.CASCADE, to="core.skill"
+            ),
+        ),
+    ]
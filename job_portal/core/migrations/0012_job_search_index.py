@@ -0,0 +1,52 @@
+from django.db import migrations
+
+SQLITE_CREATE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS core_job_fts USING fts5(
+    title, description, skills_required, location,
+    tokenize = 'porter unicode61'
+)
+"""
+
+SQLITE_POPULATE = """
+INSERT INTO core_job_fts (rowid, title, description, skills_required, location)
+SELECT id, title, description, skills_required, location FROM core_job
+"""
+
+# Must stay identical to PostgresSearchBackend.search_vector() so the planner
+# can use the index for the @@ match.
+POSTGRES_CREATE = """
+CREATE INDEX IF NOT EXISTS core_job_search_idx ON core_job USING GIN ((
+    setweight(to_tsvector('english'::regconfig, COALESCE(title, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, COALESCE(description, '')), 'D')
+    || setweight(to_tsvector('english'::regconfig, COALESCE(skills_required, '')), 'B')
+    || setweight(to_tsvector('english'::regconfig, COALESCE(location, '')), 'C')
+))
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute(SQLITE_CREATE)
+        schema_editor.execute(SQLITE_POPULATE)
+    elif vendor == "postgresql":
+        schema_editor.execute(POSTGRES_CREATE)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS core_job_fts")
+    elif vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS core_job_search_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_jobskill_skill"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:42
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_application_counters(apps, schema_editor):
+    Application = apps.get_model("core", "Application")
+    Job = apps.get_model("core", "Job")
+
+    def count(**filters):
+        counts = (
+            Application.objects.filter(job=OuterRef("pk"), **filters)
+            .order_by()
+            .values("job")
+            .annotate(n=Count("id"))
+            .values("n")
+        )
+        return Coalesce(Subquery(counts), Value(0))
+
+    Job.objects.update(
+        application_count=count(),
+        applied_count=count(status="applied"),
+        interview_count=count(status="interview"),
+        rejected_count=count(status="rejected"),
+        hired_count=count(status="hired"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_job_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="application_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="applied_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="hired_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="interview_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="rejected_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_application_counters, migrations.RunPython.noop),
+    ]
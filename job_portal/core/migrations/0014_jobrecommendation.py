@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_job_application_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobRecommendation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="core.job"
+                    ),
+                ),
+                (
+                    "seeker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core.jobseekerprofile",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["seeker", "-score"], name="core_jobrec_seeker_score_idx"
+                    )
+                ],
+                "unique_together": {("seeker", "job")},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_jobrecommendation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
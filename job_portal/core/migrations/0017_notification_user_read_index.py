@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0016_task"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "is_read"], name="core_notif_user_read_idx"
+            ),
+        ),
+    ]
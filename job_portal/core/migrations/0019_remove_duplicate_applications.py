@@ -0,0 +1,53 @@
+from django.db import migrations
+from django.db.models import Count, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicate_applications(apps, schema_editor):
+    """Keep each seeker's first application to a job and recount the jobs that had repeats."""
+    Application = apps.get_model("core", "Application")
+    Job = apps.get_model("core", "Job")
+
+    duplicates = (
+        Application.objects.values("seeker", "job")
+        .annotate(first_id=Min("id"), n=Count("id"))
+        .filter(n__gt=1)
+    )
+    job_ids = set()
+    for row in duplicates.iterator():
+        Application.objects.filter(seeker=row["seeker"], job=row["job"]).exclude(id=row["first_id"]).delete()
+        job_ids.add(row["job"])
+    if not job_ids:
+        return
+
+    def count(**filters):
+        counts = (
+            Application.objects.filter(job=OuterRef("pk"), **filters)
+            .order_by()
+            .values("job")
+            .annotate(n=Count("id"))
+            .values("n")
+        )
+        return Coalesce(Subquery(counts), Value(0))
+
+    Job.objects.filter(id__in=job_ids).update(
+        application_count=count(),
+        applied_count=count(status="applied"),
+        interview_count=count(status="interview"),
+        rejected_count=count(status="rejected"),
+        hired_count=count(status="hired"),
+    )
+
+
+class Migration(migrations.Migration):
+    # The unique constraint is added in 0020, in its own transaction: on
+    # PostgreSQL these deletes leave deferred FK trigger events pending, and
+    # altering core_application in the same transaction fails.
+
+    dependencies = [
+        ("core", "0018_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_applications, migrations.RunPython.noop),
+    ]
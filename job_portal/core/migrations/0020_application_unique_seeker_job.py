@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0019_remove_duplicate_applications"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="application",
+            name="core_app_seeker_job_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="application",
+            constraint=models.UniqueConstraint(
+                fields=("seeker", "job"), name="core_app_unique_seeker_job"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0020_application_unique_seeker_job"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["is_active", "expiry_date"], name="core_job_active_expiry_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0021_job_active_expiry_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="application",
+            name="core_app_job_status_idx",
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job", "applied_at"], name="core_app_job_applied_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job", "status", "applied_at"],
+                name="core_app_job_status_date_idx",
+            ),
+        ),
+    ]
@@ -59,6 +59,14 @@ class EmployerProfile(models.Model):
     website = models.URLField()
     logo = models.ImageField(upload_to='logos/')
     description = models.TextField()
+    # Job API responses show the company name, so their validators include this.
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class JobQuerySet(models.QuerySet):
+    def live(self):
+        """Active jobs that haven't passed their expiry date, whether or not the sweeper has run yet."""
+        return self.filter(is_active=True, expiry_date__gte=timezone.localdate())
 
 
 class Job(models.Model):
@@ -71,12 +79,58 @@ class Job(models.Model):
     salary_max = models.IntegerField()
     job_type = models.CharField(max_length=20, choices=[('full', 'Full-Time'), ('part', 'Part-Time'), ('remote', 'Remote'), ('intern', 'Internship')])
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     expiry_date = models.DateField()
     is_active = models.BooleanField(default=True)
 
+    # Maintained incrementally by core.counters; repair with `manage.py reconcile_job_counters`.
+    application_count = models.PositiveIntegerField(default=0, editable=False)
+    applied_count = models.PositiveIntegerField(default=0, editable=False)
+    interview_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_count = models.PositiveIntegerField(default=0, editable=False)
+    hired_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active', '-created_at'], name='core_job_active_created_idx'),
+            # Lets the expiry sweeper find active jobs past their date without a scan.
+            models.Index(fields=['is_active', 'expiry_date'], name='core_job_active_expiry_idx'),
+            # Matches the listing's keyset order; only built where partial indexes are supported.
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_active=True), name='core_job_active_recent_idx'),
+        ]
+
+    @property
+    def is_live(self):
+        return self.is_active and self.expiry_date >= timezone.localdate()
+
+
+class CatalogVersion(models.Model):
+    """
+    A single row, bumped by core.catalog whenever anything the job listings
+    show changes, so the listing API's validators are one primary key lookup.
+    """
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
 class JobSkill(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
-    skill_name = models.CharField(max_length=50)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, null=True)
+    skill_name = models.CharField(max_length=50, db_index=True)
+
+    class Meta:
+        unique_together = ('job', 'skill_name')
+
+class JobRecommendation(models.Model):
+    seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE)
+    score = models.FloatField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('seeker', 'job')
+        indexes = [models.Index(fields=['seeker', '-score'], name='core_jobrec_seeker_score_idx')]
 
 class SavedJob(models.Model):
     seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE)
@@ -94,6 +148,17 @@ class Application(models.Model):
     status = models.CharField(max_length=20, choices=[('applied', 'Applied'), ('interview', 'Interview Scheduled'), ('rejected', 'Rejected'), ('hired', 'Hired')], default='applied')
     applied_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Applicant pages: one job's applications, optionally of one status, by date.
+            models.Index(fields=['job', 'applied_at'], name='core_app_job_applied_idx'),
+            models.Index(fields=['job', 'status', 'applied_at'], name='core_app_job_status_date_idx'),
+        ]
+        constraints = [
+            # Also the index for "this seeker's applications" lookups.
+            models.UniqueConstraint(fields=['seeker', 'job'], name='core_app_unique_seeker_job'),
+        ]
+
 class ApplicationAnswer(models.Model):
     application = models.ForeignKey(Application, on_delete=models.CASCADE)
     question = models.CharField(max_length=200)
@@ -134,6 +199,9 @@ class Payment(models.Model):
     amount = models.DecimalField(max_digits=6, decimal_places=2)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['employer', '-timestamp'], name='core_payment_employer_ts_idx')]
+
     def __str__(self):
         return f"{self.employer.user.username} - {self.plan.name} - ${self.amount}"
 
@@ -143,6 +211,9 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['user', 'is_read'], name='core_notif_user_read_idx')]
+
 class Review(models.Model):
     seeker = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE)
     employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE)
@@ -178,3 +249,28 @@ class SearchLog(models.Model):
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     query = models.CharField(max_length=200)
     searched_at = models.DateTimeField(auto_now_add=True)
+
+
+class Task(models.Model):
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    idempotency_key = models.CharField(max_length=200, unique=True, null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'run_after'], name='core_task_status_run_idx')]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
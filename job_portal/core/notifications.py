@@ -0,0 +1,91 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .caching import cache_is_shared
+from .models import Notification
+
+NOTIFY_BATCH_SIZE = 1000
+
+UNREAD_COUNT_TIMEOUT = 60 * 60 * 24
+
+
+def unread_count_key(user_id):
+    return f'notifications:unread:{user_id}'
+
+
+def unread_generation_key(user_id):
+    return f'notifications:unread-generation:{user_id}'
+
+
+def counts_cached():
+    """
+    Whether unread counts are cached. Notifications are mostly created by the
+    task worker, a separate process, so only a shared cache can be kept current.
+    """
+    return cache_is_shared()
+
+
+def _invalidate_unread_counts(user_ids):
+    # A new generation outdates any count stored under the old one, including
+    # one whose COUNT ran before this write committed but is stored after it.
+    if counts_cached():
+        cache.set_many({unread_generation_key(user_id): uuid4().hex for user_id in user_ids}, UNREAD_COUNT_TIMEOUT)
+
+
+def notify_many(user_ids, message, batch_size=NOTIFY_BATCH_SIZE):
+    """
+    Send ``message`` to every user in ``user_ids``.
+
+    Rows are written with one bulk INSERT per ``batch_size`` users, and each
+    recipient's cached unread count is invalidated once the transaction commits.
+    """
+    user_ids = list(user_ids)
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start:start + batch_size]
+        Notification.objects.bulk_create([Notification(user_id=user_id, message=message) for user_id in batch])
+        transaction.on_commit(lambda batch=batch: _invalidate_unread_counts(batch))
+
+
+def notify(user, message):
+    notify_many([user.pk], message)
+
+
+def get_unread_count(user_id):
+    """
+    The user's unread notification count, served from the cache when it is shared.
+
+    A cold or outdated entry is refilled with one COUNT over the (user, is_read)
+    index, never a scan of the notification table.
+    """
+    unread = Notification.objects.filter(user_id=user_id, is_read=False)
+    if not counts_cached():
+        return unread.count()
+
+    generation_key, key = unread_generation_key(user_id), unread_count_key(user_id)
+    cached = cache.get_many([generation_key, key])
+    generation = cached.get(generation_key)
+    if generation is not None and cached.get(key, (None,))[0] == generation:
+        return cached[key][1]
+
+    if generation is None:
+        generation = uuid4().hex
+        if not cache.add(generation_key, generation, UNREAD_COUNT_TIMEOUT):
+            generation = cache.get(generation_key, generation)
+    # Read the generation before counting: a write committed after this point
+    # replaces it, so the count stored here is never served for it.
+    count = unread.count()
+    cache.set(key, (generation, count), UNREAD_COUNT_TIMEOUT)
+    return count
+
+
+def mark_read(user, notification_ids=None):
+    """Mark the user's unread notifications (or just ``notification_ids``) read."""
+    unread = Notification.objects.filter(user=user, is_read=False)
+    if notification_ids is not None:
+        unread = unread.filter(id__in=notification_ids)
+    marked = unread.update(is_read=True)
+    if marked:
+        transaction.on_commit(lambda: _invalidate_unread_counts([user.pk]))
+    return marked
@@ -0,0 +1,144 @@
+"""
+Detection of N+1 query patterns: the same query shape run again and again in
+one request, typically from a template loop touching a relation that wasn't
+select_related/prefetch_related.
+
+NPlusOneMiddleware watches every request while NPLUSONE_ENABLED is set (on
+with DEBUG). It logs each repeated shape with the view, the template line and
+the code line that issued it, and raises NPlusOneError instead when
+NPLUSONE_RAISE is set, which makes any test that requests the page fail.
+detect_n_plus_one() does the same for a block of test code.
+"""
+import logging
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 3
+
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_IGNORED = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def query_shape(sql):
+    """``sql`` with variable-length IN lists collapsed, so batches of any size count as one shape."""
+    return _IN_LIST.sub('IN (...)', sql)
+
+
+# Query wrappers of our own, which sit between Django's cursor and the code that ran the query.
+_INSTRUMENTATION_FILES = {__file__, metrics.__file__}
+
+
+def _caller():
+    """(template line, code line) of the innermost template node and project frame on the stack."""
+    template = code = None
+    project_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+    while frame is not None and (template is None or code is None):
+        filename = frame.f_code.co_filename
+        if template is None and frame.f_code.co_name == 'render_annotated':
+            node = frame.f_locals.get('self')
+            origin, token = getattr(node, 'origin', None), getattr(node, 'token', None)
+            if origin is not None and token is not None:
+                template = f"{origin.template_name}:{token.lineno}"
+        elif code is None and filename.startswith(project_dir) and 'site-packages' not in filename \
+                and filename not in _INSTRUMENTATION_FILES:
+            code = f"{Path(filename).relative_to(project_dir)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return template, code
+
+
+class QueryLog:
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.counts = {}
+        self.callers = {}
+        self._lock = threading.Lock()
+
+    def add(self, sql):
+        if sql.startswith(_IGNORED):
+            return
+        shape = query_shape(sql)
+        with self._lock:
+            count = self.counts[shape] = self.counts.get(shape, 0) + 1
+        if count == 2:
+            # The first repeat, rather than the first run, is the one inside the loop.
+            self.callers[shape] = _caller()
+
+    def repeated(self):
+        """[(shape, count, template line, code line)] for every shape run at least ``threshold`` times."""
+        return [
+            (shape, count, *self.callers[shape])
+            for shape, count in self.counts.items()
+            if count >= self.threshold
+        ]
+
+    def report(self, view=None):
+        where = f" in view {view!r}" if view else ""
+        lines = []
+        for shape, count, template, code in self.repeated():
+            origin = '; '.join(part for part in (template and f"template {template}", code) if part)
+            lines.append(f"N+1{where}: {count} x {shape} ({origin or 'unknown origin'})")
+        return '\n'.join(lines)
+
+
+_current_log = ContextVar('current_query_log', default=None)
+
+
+def _log_query(execute, sql, params, many, context):
+    query_log = _current_log.get()
+    if query_log is not None:
+        query_log.add(sql)
+    return execute(sql, params, many, context)
+
+
+def _instrument_connection(connection, **kwargs):
+    if _log_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _log_query)
+
+
+_installed = False
+
+
+def _install():
+    global _installed
+    if not _installed:
+        _installed = True
+        connection_created.connect(_instrument_connection)
+    for connection in connections.all(initialized_only=True):
+        _instrument_connection(connection)
+
+
+@contextmanager
+def detect_n_plus_one(threshold=DEFAULT_THRESHOLD, raise_error=True):
+    """
+    Collect the queries run inside the block, in this and any sync_to_async threads.
+
+    Raises NPlusOneError on exit if a query shape ran ``threshold`` or more
+    times; with ``raise_error=False`` the QueryLog is just yielded for inspection.
+    """
+    _install()
+    query_log = QueryLog(threshold)
+    token = _current_log.set(query_log)
+    try:
+        yield query_log
+    finally:
+        _current_log.reset(token)
+    report = query_log.report()
+    if report and raise_error:
+        raise NPlusOneError(report)
@@ -0,0 +1,92 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+
+PAGE_SIZE = 20
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def encode_cursor(values):
+    values = [v.isoformat() if isinstance(v, (datetime.date, datetime.datetime)) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model, ordering):
+    """Return the typed cursor values, or None if the cursor is missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(values, list) or len(values) != len(ordering):
+        return None
+
+    typed = []
+    for name, value in zip(ordering, values):
+        try:
+            typed.append(model._meta.get_field(name.lstrip('-')).to_python(value))
+        except FieldDoesNotExist:
+            # Annotations (e.g. a search rank) are stored as plain JSON values.
+            typed.append(value)
+        except ValidationError:
+            return None
+    return typed
+
+
+def keyset_filter(ordering, values):
+    """
+    Build the "comes after this row" condition for an ordering such as
+    ('-created_at', '-id'): created_at < x OR (created_at = x AND id < y).
+    """
+    condition = Q()
+    for i, (name, value) in enumerate(zip(ordering, values)):
+        field = name.lstrip('-')
+        lookup = 'lt' if name.startswith('-') else 'gt'
+        step = Q(**{f'{field}__{lookup}': value})
+        for previous, previous_value in zip(ordering[:i], values[:i]):
+            step &= Q(**{previous.lstrip('-'): previous_value})
+        condition |= step
+    return condition
+
+
+def keyset_page(queryset, ordering, cursor=None, page_size=PAGE_SIZE):
+    """
+    Return one page of ``queryset`` in ``ordering``, starting after ``cursor``.
+
+    The last ordering field must be unique (normally the primary key) so that
+    every row has a distinct position. Each page is a single indexed range
+    query, however deep into the result set it is.
+    """
+    queryset = queryset.order_by(*ordering)
+    values = decode_cursor(cursor, queryset.model, ordering)
+    if values is not None:
+        queryset = queryset.filter(keyset_filter(ordering, values))
+
+    rows = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        if not isinstance(last, dict):
+            last = {name.lstrip('-'): getattr(last, name.lstrip('-')) for name in ordering}
+        next_cursor = encode_cursor([last[name.lstrip('-')] for name in ordering])
+    return KeysetPage(rows, next_cursor)
@@ -0,0 +1,52 @@
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from .caching import cache_is_shared
+from .models import JobSeekerProfile
+
+SECTION_LOOKUPS = ('experience_set', 'education_set', 'certification_set', 'portfolio_set')
+
+PROFILE_SECTIONS_TIMEOUT = 60 * 60 * 24
+# With a per-process cache an edit only invalidates the process that handled
+# it; the others serve the old sections for at most this long.
+PROFILE_SECTIONS_LOCAL_TIMEOUT = 60
+
+
+def profile_sections_timeout():
+    return PROFILE_SECTIONS_TIMEOUT if cache_is_shared() else PROFILE_SECTIONS_LOCAL_TIMEOUT
+
+
+def profile_sections_cache_key(seeker_id):
+    return f'seeker-profile-sections:{seeker_id}'
+
+
+def invalidate_profile_sections(seeker_id):
+    cache.delete(profile_sections_cache_key(seeker_id))
+
+
+def load_seeker_profile(user):
+    """
+    Return ``(seeker, sections_html)`` for the profile page.
+
+    The experience/education/certification/portfolio sections are served from
+    a per-seeker cache; on a miss they are loaded with a single prefetch pass
+    (together with the skills the profile form needs) and rendered into it.
+    """
+    seeker, created = JobSeekerProfile.objects.get_or_create(user=user)
+    key = profile_sections_cache_key(seeker.pk)
+    sections = cache.get(key)
+
+    lookups = ['skills'] if sections is not None else ['skills', *SECTION_LOOKUPS]
+    prefetch_related_objects([seeker], *lookups)
+
+    if sections is None:
+        sections = render_to_string('core/profile_sections.html', {
+            'experiences': seeker.experience_set.all(),
+            'educations': seeker.education_set.all(),
+            'certifications': seeker.certification_set.all(),
+            'portfolios': seeker.portfolio_set.all(),
+        })
+        cache.set(key, sections, profile_sections_timeout())
+    return seeker, mark_safe(sections)
@@ -0,0 +1,112 @@
+from django.db.models import Count, ExpressionWrapper, F, FloatField, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .models import Job, JobRecommendation, JobSeekerProfile, JobSkill
+
+# Recommendations kept per seeker. More than the dashboard shows, so the list
+# still fills up when some of the stored jobs close; a list a job drops out of
+# is refilled with the next-best matches (see refill()).
+TOP_K = 20
+
+
+def match_score(matched, total):
+    """Percentage of a job's skills the seeker has; the dashboard's match score."""
+    return matched * 100.0 / total if total else 0.0
+
+
+def score_jobs_for_seeker(seeker):
+    """Active jobs sharing at least one skill with ``seeker``, annotated with ``score``."""
+    seeker_skills = seeker.skills.values('id')
+    candidate_ids = JobSkill.objects.filter(skill__in=seeker_skills).values('job_id')
+    return Job.objects.live().filter(id__in=candidate_ids).annotate(
+        skill_count=Count('jobskill'),
+        matched_count=Count('jobskill', filter=Q(jobskill__skill__in=seeker_skills)),
+    ).annotate(
+        score=ExpressionWrapper(F('matched_count') * 100.0 / F('skill_count'), output_field=FloatField()),
+    )
+
+
+def refresh_for_seeker(seeker):
+    """Recompute the stored top-K recommendations of one seeker."""
+    top = score_jobs_for_seeker(seeker).order_by('-score', '-id').values_list('id', 'score')[:TOP_K]
+    rows = [JobRecommendation(seeker=seeker, job_id=job_id, score=score) for job_id, score in top]
+    JobRecommendation.objects.filter(seeker=seeker).delete()
+    JobRecommendation.objects.bulk_create(rows)
+
+
+def refill(seeker_ids):
+    """
+    Recompute the lists of the given seekers that have fallen below TOP_K.
+
+    Called for seekers who lost a job from their list, so the next-best match
+    takes its place. Lists that are short because the seeker matches fewer
+    than TOP_K jobs are rescored too; that costs one query and changes nothing.
+    """
+    seeker_ids = set(seeker_ids)
+    if not seeker_ids:
+        return
+    full = (
+        JobRecommendation.objects.filter(seeker_id__in=seeker_ids)
+        .values('seeker_id').annotate(n=Count('id')).filter(n__gte=TOP_K).values_list('seeker_id', flat=True)
+    )
+    for seeker in JobSeekerProfile.objects.filter(id__in=seeker_ids - set(full)).order_by('id').iterator():
+        refresh_for_seeker(seeker)
+
+
+def refresh_for_job(job):
+    """Rescore ``job`` against every seeker that shares a skill with it, refilling lists it dropped out of."""
+    previous = set(JobRecommendation.objects.filter(job=job).values_list('seeker_id', flat=True))
+    JobRecommendation.objects.filter(job=job).delete()
+    if not job.is_live:
+        refill(previous)
+        return
+
+    job_skill_ids = list(JobSkill.objects.filter(job=job, skill__isnull=False).values_list('skill_id', flat=True))
+    if not job_skill_ids:
+        refill(previous)
+        return
+
+    through = JobSeekerProfile.skills.through
+    matches = (
+        through.objects.filter(skill_id__in=job_skill_ids)
+        .values('jobseekerprofile_id')
+        .annotate(matched=Count('id'))
+        .values_list('jobseekerprofile_id', 'matched')
+    )
+    total = JobSkill.objects.filter(job=job).count()
+    rows = [
+        JobRecommendation(seeker_id=seeker_id, job=job, score=match_score(matched, total))
+        for seeker_id, matched in matches
+    ]
+    JobRecommendation.objects.bulk_create(rows, batch_size=1000)
+    trim([row.seeker_id for row in rows])
+    refill(previous - {row.seeker_id for row in rows})
+
+
+def trim(seeker_ids, batch_size=500):
+    """Drop everything below the top K recommendations of the given seekers."""
+    seeker_ids = list(seeker_ids)
+    for start in range(0, len(seeker_ids), batch_size):
+        overflow = list(
+            JobRecommendation.objects.filter(seeker_id__in=seeker_ids[start:start + batch_size])
+            .annotate(rank=Window(
+                RowNumber(),
+                partition_by=[F('seeker_id')],
+                order_by=[F('score').desc(), F('job_id').desc()],
+            ))
+            .filter(rank__gt=TOP_K)
+            .values_list('id', flat=True)
+        )
+        if overflow:
+            JobRecommendation.objects.filter(id__in=overflow).delete()
+
+
+def top_recommendations(seeker, limit=5):
+    """The seeker's best stored matches as (job, score) pairs, in one indexed query."""
+    recommendations = (
+        JobRecommendation.objects.filter(seeker=seeker, job__is_active=True, job__expiry_date__gte=timezone.localdate())
+        .select_related('job')
+        .order_by('-score', '-job_id')[:limit]
+    )
+    return [(rec.job, round(rec.score, 1)) for rec in recommendations]
@@ -0,0 +1,145 @@
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+SEARCH_FIELDS = ('title', 'description', 'skills_required', 'location')
+
+# Relative weight of each field in the ranking, in SEARCH_FIELDS order.
+FIELD_WEIGHTS = (10.0, 1.0, 5.0, 2.0)
+
+
+def no_matches(queryset):
+    """The result of a query without any searchable words; still ordered by rank like any other."""
+    return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class BaseSearchBackend:
+    """
+    Keeps a full-text index of jobs and filters/ranks Job querysets against it.
+
+    search() returns the queryset restricted to matching jobs and annotated with
+    ``search_rank``, where a higher rank means a better match.
+    """
+
+    def index_job(self, job):
+        pass
+
+    def index_jobs(self, jobs):
+        for job in jobs:
+            self.index_job(job)
+
+    def remove_job(self, job_id):
+        pass
+
+    def search(self, queryset, query):
+        raise NotImplementedError
+
+
+class BasicSearchBackend(BaseSearchBackend):
+    """Unindexed fallback for databases without a native full-text engine."""
+
+    def search(self, queryset, query):
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return no_matches(queryset)
+        for term in terms:
+            match = Q()
+            for field in SEARCH_FIELDS:
+                match |= Q(**{f'{field}__icontains': term})
+            queryset = queryset.filter(match)
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """SQLite FTS5 table keyed by job id, ranked with bm25()."""
+
+    table = 'core_job_fts'
+
+    def index_job(self, job):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [job.pk])
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s, %s)",
+                [job.pk] + [getattr(job, field) or '' for field in SEARCH_FIELDS],
+            )
+
+    def index_jobs(self, jobs):
+        rows = [[job.pk] + [getattr(job, field) or '' for field in SEARCH_FIELDS] for job in jobs]
+        with connection.cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [row[:1] for row in rows])
+            cursor.executemany(
+                f"INSERT INTO {self.table} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s, %s)",
+                rows,
+            )
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [job_id])
+
+    def search(self, queryset, query):
+        # Quote every term so user input can't inject FTS5 query syntax; the
+        # trailing * makes each term a prefix match ("devel" finds "developer").
+        terms = re.findall(r'\w+', query.lower())
+        if not terms:
+            return no_matches(queryset)
+        match = ' '.join(f'"{term}"*' for term in terms)
+
+        weights = ', '.join(str(weight) for weight in FIELD_WEIGHTS)
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s", [match]),
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -bm25({self.table}, {weights}) FROM {self.table} "
+                f"WHERE {self.table} MATCH %s AND rowid = {table}.id",
+                [match],
+                output_field=FloatField(),
+            ),
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Postgres full-text search over a weighted tsvector.
+
+    The vector is computed from the row, so nothing has to be kept in sync; the
+    GIN expression index created in migration 0012 serves the match.
+    """
+
+    config = 'english'
+
+    def search_vector(self):
+        from django.contrib.postgres.search import SearchVector
+
+        # Tsvector weights only go A > B > C > D; this order mirrors FIELD_WEIGHTS.
+        vector = None
+        for field, weight in zip(SEARCH_FIELDS, 'ADBC'):
+            part = SearchVector(field, weight=weight, config=self.config)
+            vector = part if vector is None else vector + part
+        return vector
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        search_query = SearchQuery(query, search_type='websearch', config=self.config)
+        vector = self.search_vector()
+        return queryset.annotate(search_document=vector).filter(search_document=search_query).annotate(
+            search_rank=SearchRank(vector, search_query),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    path = getattr(settings, 'JOB_SEARCH_BACKEND', None)
+    if path:
+        return import_string(path)()
+    if connection.vendor == 'sqlite':
+        return SQLiteFTSBackend()
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    return BasicSearchBackend()
@@ -0,0 +1,424 @@
+"""
+Synthetic data for benchmarks and staging, written with bulk inserts.
+
+Everything is drawn from random.Random instances derived from the caller's
+seed, one per step and per chunk, so the same scale and seed produce the same
+rows however many workers generate them. bulk_create() doesn't send model
+signals, so the data they would maintain (JobSkill rows, application counters,
+the search index, stored recommendations, the catalog version) is written
+here directly.
+"""
+import datetime
+import random
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .catalog import bump_catalog_version
+from .concurrency import in_worker_thread
+from .counters import actual_counts
+from .models import (
+    Application, EmployerProfile, EmployerSubscription, Job, JobRecommendation, JobSeekerProfile, JobSkill, Payment,
+    Review, SavedJob, SubscriptionPlan, User,
+)
+from .recommendations import refresh_for_seeker
+from .search import get_search_backend
+from .skills import ensure_skills
+
+BATCH_SIZE = 2000
+
+# Every seeded account can log in with this password.
+SEED_PASSWORD = 'portal-seed'
+
+# Job families: (share of jobs and seekers, titles, skills from most to least common).
+FAMILIES = {
+    'backend': (35, ('Backend Developer', 'Software Engineer', 'Full Stack Developer'), (
+        'python', 'sql', 'java', 'django', 'postgresql', 'node.js', 'docker', 'aws', 'git', 'spring', 'go',
+        'c#', '.net', 'php', 'laravel', 'ruby', 'rails', 'kotlin', 'rust', 'linux',
+    )),
+    'frontend': (25, ('Frontend Developer', 'Full Stack Developer', 'Web Developer'), (
+        'javascript', 'react', 'html', 'css', 'typescript', 'git', 'vue', 'node.js', 'figma',
+    )),
+    'data': (15, ('Data Engineer', 'Data Analyst', 'Machine Learning Engineer'), (
+        'python', 'sql', 'excel', 'pandas', 'machine learning', 'tableau', 'spark', 'aws', 'postgresql',
+    )),
+    'devops': (10, ('DevOps Engineer', 'Site Reliability Engineer', 'Cloud Engineer'), (
+        'docker', 'aws', 'kubernetes', 'linux', 'terraform', 'git', 'python', 'azure', 'gcp', 'go',
+    )),
+    'mobile': (10, ('Mobile Developer', 'iOS Developer', 'Android Developer'), (
+        'kotlin', 'swift', 'android', 'java', 'react', 'javascript', 'git', 'figma',
+    )),
+    'design': (5, ('Product Designer', 'UX Designer'), (
+        'figma', 'css', 'html', 'project management', 'excel',
+    )),
+}
+FAMILY_NAMES = tuple(FAMILIES)
+FAMILY_WEIGHTS = tuple(share for share, titles, skills in FAMILIES.values())
+SKILLS = tuple(sorted({skill for share, titles, skills in FAMILIES.values() for skill in skills}))
+
+# Share of skills, applications and saved jobs picked outside the seeker's or job's own family.
+CROSS_FAMILY_SHARE = 0.2
+
+LEVELS = {'Junior': (30, 60), '': (50, 100), 'Senior': (80, 150), 'Lead': (110, 190)}  # salary, thousands
+INDUSTRIES = ('Software', 'Finance', 'Healthcare', 'Retail', 'Education', 'Logistics', 'Media', 'Telecom')
+LOCATIONS = (
+    'Remote', 'New York', 'San Francisco', 'London', 'Berlin', 'Toronto', 'Bangalore', 'Karachi', 'Lahore',
+    'Dubai', 'Singapore', 'Sydney',
+)
+LOCATION_WEIGHTS = (25, 12, 10, 10, 6, 6, 8, 5, 5, 5, 4, 4)
+JOB_TYPES = [value for value, label in Job._meta.get_field('job_type').choices]
+JOB_TYPE_WEIGHTS = (60, 10, 25, 5)
+STATUS_WEIGHTS = {'applied': 70, 'interview': 15, 'rejected': 12, 'hired': 3}
+RATING_WEIGHTS = {5: 35, 4: 35, 3: 15, 2: 8, 1: 7}
+REVIEW_COMMENTS = (
+    "Smooth hiring process.", "Quick to respond.", "Interview was well organised.",
+    "Never heard back after applying.", "Friendly team.", "The role was not as described.",
+)
+DEFAULT_PLANS = (('Basic', Decimal('9.99'), 5), ('Pro', Decimal('29.99'), 25), ('Enterprise', Decimal('99.99'), None))
+
+
+def step_rng(seed, *step):
+    """An independent, reproducible RNG for one step (and chunk) of the generation."""
+    return random.Random(':'.join(str(part) for part in (seed, *step)))
+
+
+def pick_skills(rng, family, count):
+    """``count`` distinct skills of ``family``, weighted towards its common ones (Zipf), sometimes plus one other."""
+    names = list(FAMILIES[family][2])
+    weights = [1 / rank for rank in range(1, len(names) + 1)]
+    picked = []
+    while names and len(picked) < count:
+        i = rng.choices(range(len(names)), weights)[0]
+        picked.append(names.pop(i))
+        weights.pop(i)
+    if rng.random() < CROSS_FAMILY_SHARE:
+        extra = rng.choice(SKILLS)
+        if extra not in picked:
+            picked.append(extra)
+    return picked
+
+
+class WeightedJobs:
+    """Job ids grouped by family, each with a long-tailed popularity, for picking application targets."""
+
+    def __init__(self, rng, job_ids, job_families):
+        popularity = [rng.lognormvariate(0, 1) for _ in job_ids]
+        self.job_ids = job_ids
+        self.all = (job_ids, list(accumulate(popularity)))
+        by_family = {}
+        for job_id, family, weight in zip(job_ids, job_families, popularity):
+            ids, weights = by_family.setdefault(family, ([], []))
+            ids.append(job_id)
+            weights.append(weight)
+        self.by_family = {family: (ids, list(accumulate(weights))) for family, (ids, weights) in by_family.items()}
+
+    def sample(self, rng, family, count):
+        """Up to ``count`` distinct job ids, mostly from ``family``."""
+        picked = set()
+        for _ in range(count * 3):
+            if len(picked) >= count:
+                break
+            ids, cum_weights = self.all
+            if family in self.by_family and rng.random() >= CROSS_FAMILY_SHARE:
+                ids, cum_weights = self.by_family[family]
+            picked.add(rng.choices(ids, cum_weights=cum_weights)[0])
+        return sorted(picked)
+
+
+def _bulk_create(model, objs, batch_size):
+    created = model.objects.bulk_create(objs, batch_size=batch_size)
+    if created and created[0].pk is None:
+        raise RuntimeError(f"{connection.vendor} doesn't return primary keys from bulk inserts; seeding needs them.")
+    return created
+
+
+def _batches(count, batch_size):
+    for start in range(0, count, batch_size):
+        yield range(start, min(start + batch_size, count))
+
+
+def _spread(rng, total, buckets):
+    """Randomly split ``total`` over ``buckets`` counters."""
+    counts = [0] * buckets
+    for _ in range(total if buckets else 0):
+        counts[rng.randrange(buckets)] += 1
+    return counts
+
+
+def max_workers(requested):
+    # SQLite allows one writer at a time, so extra threads would only queue on its lock.
+    return 1 if connection.vendor == 'sqlite' else max(requested, 1)
+
+
+def _atomic(func):
+    def run(*args):
+        with transaction.atomic():
+            return func(*args)
+    return run
+
+
+def run_chunks(func, chunks, workers):
+    """
+    Call ``func(*chunk)`` for every chunk, each in its own transaction.
+
+    Where the database takes concurrent writers the chunks run on ``workers``
+    threads, each with a connection of its own.
+    """
+    chunks = list(chunks)
+    if max_workers(workers) == 1 or len(chunks) < 2:
+        results = []
+        for chunk in chunks:
+            with transaction.atomic():
+                results.append(func(*chunk))
+        return results
+    with ThreadPoolExecutor(max_workers(workers)) as pool:
+        return list(pool.map(in_worker_thread(_atomic(func), keep_connections=False), *zip(*chunks)))
+
+
+def create_employers(seed, count, prefix, batch_size, password):
+    rng = step_rng(seed, 'employers')
+    employer_ids = []
+    for batch in _batches(count, batch_size):
+        with transaction.atomic():
+            users = _bulk_create(User, [
+                User(username=f'{prefix}-employer-{i}', email=f'{prefix}-employer-{i}@example.com', role='employer', password=password)
+                for i in batch
+            ], batch_size)
+            profiles = _bulk_create(EmployerProfile, [
+                EmployerProfile(
+                    user=user, company_name=f'Company {i}', industry=rng.choice(INDUSTRIES),
+                    website=f'https://company{i}.example.com', logo='logos/default.png', description='',
+                )
+                for i, user in zip(batch, users)
+            ], batch_size)
+        employer_ids.extend(profile.pk for profile in profiles)
+    return employer_ids
+
+
+def create_seekers(seed, count, prefix, batch_size, password, skill_ids):
+    """Create seekers with their skills; return (profile ids, job family of each)."""
+    rng = step_rng(seed, 'seekers')
+    through = JobSeekerProfile.skills.through
+    seeker_ids, families = [], []
+    for batch in _batches(count, batch_size):
+        batch_families = rng.choices(FAMILY_NAMES, FAMILY_WEIGHTS, k=len(batch))
+        with transaction.atomic():
+            users = _bulk_create(User, [
+                User(username=f'{prefix}-seeker-{i}', email=f'{prefix}-seeker-{i}@example.com', role='seeker', password=password)
+                for i in batch
+            ], batch_size)
+            profiles = _bulk_create(JobSeekerProfile, [
+                JobSeekerProfile(
+                    user=user, phone=f'+1555{rng.randrange(10 ** 7):07d}',
+                    location=rng.choices(LOCATIONS, LOCATION_WEIGHTS)[0], resume='resumes/sample.pdf', bio='',
+                )
+                for user in users
+            ], batch_size)
+            through.objects.bulk_create([
+                through(jobseekerprofile_id=profile.pk, skill_id=skill_ids[name])
+                for profile, family in zip(profiles, batch_families)
+                for name in pick_skills(rng, family, rng.randint(3, 8))
+            ], batch_size=batch_size)
+        seeker_ids.extend(profile.pk for profile in profiles)
+        families.extend(batch_families)
+    return seeker_ids, families
+
+
+def create_jobs(seed, count, employer_ids, skill_ids, batch_size):
+    """Create jobs with their JobSkill rows and search index entries; return (job ids, job family of each)."""
+    rng = step_rng(seed, 'jobs')
+    today = timezone.localdate()
+    search = get_search_backend()
+    job_ids, families = [], []
+    for batch in _batches(count, batch_size):
+        jobs, job_skills = [], []
+        batch_families = rng.choices(FAMILY_NAMES, FAMILY_WEIGHTS, k=len(batch))
+        for family in batch_families:
+            skills = pick_skills(rng, family, rng.randint(2, 6))
+            level = rng.choice(tuple(LEVELS))
+            low, high = LEVELS[level]
+            salary_min = rng.randint(low, high) * 1000
+            title = f"{level} {rng.choice(FAMILIES[family][1])}".strip()
+            jobs.append(Job(
+                employer_id=rng.choice(employer_ids),
+                title=title,
+                description=f"We are hiring a {title} to work with {', '.join(skills)}.",
+                skills_required=', '.join(skills),
+                location=rng.choices(LOCATIONS, LOCATION_WEIGHTS)[0],
+                salary_min=salary_min,
+                salary_max=salary_min + rng.randrange(5, 40) * 1000,
+                job_type=rng.choices(JOB_TYPES, JOB_TYPE_WEIGHTS)[0],
+                expiry_date=today + datetime.timedelta(days=rng.randint(-30, 90)),
+            ))
+            job_skills.append(skills)
+        with transaction.atomic():
+            jobs = _bulk_create(Job, jobs, batch_size)
+            JobSkill.objects.bulk_create([
+                JobSkill(job_id=job.pk, skill_id=skill_ids[name], skill_name=name)
+                for job, skills in zip(jobs, job_skills)
+                for name in skills
+            ], batch_size=batch_size)
+            search.index_jobs(jobs)
+        job_ids.extend(job.pk for job in jobs)
+        families.extend(batch_families)
+    return job_ids, families
+
+
+def create_applications(seed, count, seekers, weighted_jobs, batch_size, workers=1):
+    """Spread ``count`` applications over the seekers, never twice to the same job; return how many were made."""
+    seeker_ids, seeker_families = seekers
+    per_seeker = _spread(step_rng(seed, 'applications'), count, len(seeker_ids))
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+
+    def create(chunk, start):
+        rng = step_rng(seed, 'applications', chunk)
+        rows = [
+            Application(
+                job_id=job_id, seeker_id=seeker_ids[i], resume='resumes/sample.pdf',
+                status=rng.choices(statuses, weights)[0],
+            )
+            for i in range(start, min(start + batch_size, len(seeker_ids)))
+            for job_id in weighted_jobs.sample(rng, seeker_families[i], per_seeker[i])
+        ]
+        Application.objects.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+    created = sum(run_chunks(create, enumerate(range(0, len(seeker_ids), batch_size)), workers))
+
+    # One UPDATE fills the counters that the post_save signal would have kept.
+    if weighted_jobs.job_ids:
+        Job.objects.filter(
+            id__gte=min(weighted_jobs.job_ids), id__lte=max(weighted_jobs.job_ids),
+        ).update(**actual_counts())
+    return created
+
+
+def create_saved_jobs(seed, count, seekers, weighted_jobs, batch_size, workers=1):
+    seeker_ids, seeker_families = seekers
+    per_seeker = _spread(step_rng(seed, 'saved-jobs'), count, len(seeker_ids))
+
+    def create(chunk, start):
+        rng = step_rng(seed, 'saved-jobs', chunk)
+        rows = [
+            SavedJob(seeker_id=seeker_ids[i], job_id=job_id)
+            for i in range(start, min(start + batch_size, len(seeker_ids)))
+            for job_id in weighted_jobs.sample(rng, seeker_families[i], per_seeker[i])
+        ]
+        SavedJob.objects.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+    return sum(run_chunks(create, enumerate(range(0, len(seeker_ids), batch_size)), workers))
+
+
+def create_payments(seed, count, employer_ids, batch_size):
+    """Payments by random employers; each paying employer is subscribed to the plan of its last payment."""
+    rng = step_rng(seed, 'payments')
+    plans = list(SubscriptionPlan.objects.order_by('id'))
+    if not plans:
+        plans = _bulk_create(SubscriptionPlan, [
+            SubscriptionPlan(name=name, price=price, max_jobs=max_jobs) for name, price, max_jobs in DEFAULT_PLANS
+        ], batch_size)
+    payments = []
+    latest_plan = {}
+    for _ in range(count if employer_ids else 0):
+        employer_id, plan = rng.choice(employer_ids), rng.choice(plans)
+        payments.append(Payment(employer_id=employer_id, plan=plan, amount=plan.price))
+        latest_plan[employer_id] = plan
+    with transaction.atomic():
+        Payment.objects.bulk_create(payments, batch_size=batch_size)
+        EmployerSubscription.objects.bulk_create(
+            [EmployerSubscription(employer_id=employer_id, plan=plan) for employer_id, plan in latest_plan.items()],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+    return len(payments)
+
+
+def create_reviews(seed, count, seeker_ids, employer_ids, batch_size):
+    rng = step_rng(seed, 'reviews')
+    ratings, weights = zip(*RATING_WEIGHTS.items())
+    reviews = [
+        Review(
+            seeker_id=rng.choice(seeker_ids), employer_id=rng.choice(employer_ids),
+            rating=rng.choices(ratings, weights)[0], comment=rng.choice(REVIEW_COMMENTS),
+        )
+        for _ in range(count if seeker_ids and employer_ids else 0)
+    ]
+    Review.objects.bulk_create(reviews, batch_size=batch_size)
+    return len(reviews)
+
+
+def create_recommendations(seeker_ids, batch_size):
+    """Store each seeker's top-K recommendations, as the worker would have after their jobs were posted."""
+    for batch in _batches(len(seeker_ids), batch_size):
+        with transaction.atomic():
+            for seeker in JobSeekerProfile.objects.filter(id__in=[seeker_ids[i] for i in batch]).order_by('id'):
+                refresh_for_seeker(seeker)
+    return JobRecommendation.objects.filter(seeker_id__in=seeker_ids).count()
+
+
+def check_scale(employers, seekers, jobs, applications, saved_jobs=0, payments=0, reviews=0, batch_size=BATCH_SIZE):
+    """Raise ValueError if the counts can't be generated, e.g. jobs without any employer to post them."""
+    counts = {
+        'employers': employers, 'seekers': seekers, 'jobs': jobs, 'applications': applications,
+        'saved jobs': saved_jobs, 'payments': payments, 'reviews': reviews,
+    }
+    for name, count in counts.items():
+        if count < 0:
+            raise ValueError(f"The number of {name} can't be negative.")
+    if batch_size < 1:
+        raise ValueError("The batch size must be at least 1.")
+    needs = {
+        'jobs': ('employers',),
+        'applications': ('seekers', 'jobs'),
+        'saved jobs': ('seekers', 'jobs'),
+        'payments': ('employers',),
+        'reviews': ('seekers', 'employers'),
+    }
+    for name, required in needs.items():
+        for other in required:
+            if counts[name] and not counts[other]:
+                raise ValueError(f"Can't generate {name} without any {other}.")
+
+
+def seed_portal(employers, seekers, jobs, applications, saved_jobs=0, payments=0, reviews=0,
+                seed=0, prefix='seed', batch_size=BATCH_SIZE, workers=1, log=None):
+    """
+    Generate a complete dataset and return the ids of what was created.
+
+    Usernames are ``<prefix>-<role>-<n>``; use a new prefix to add a second
+    dataset to the same database. Applications and saved jobs are written by
+    up to ``workers`` threads where the database supports concurrent writers.
+    """
+    check_scale(employers, seekers, jobs, applications, saved_jobs, payments, reviews, batch_size)
+    log = log or (lambda message: None)
+    password = make_password(SEED_PASSWORD)
+    skill_ids = ensure_skills(SKILLS)
+
+    employer_ids = create_employers(seed, employers, prefix, batch_size, password)
+    log(f"Created {len(employer_ids)} employers.")
+    seeker_ids, seeker_families = create_seekers(seed, seekers, prefix, batch_size, password, skill_ids)
+    log(f"Created {len(seeker_ids)} seekers.")
+    job_ids, job_families = create_jobs(seed, jobs, employer_ids, skill_ids, batch_size)
+    log(f"Created {len(job_ids)} jobs.")
+    # Nor the ones that tell API clients the listings changed.
+    bump_catalog_version()
+
+    seekers = (seeker_ids, seeker_families)
+    weighted_jobs = WeightedJobs(step_rng(seed, 'popularity'), job_ids, job_families)
+    created = create_applications(seed, applications, seekers, weighted_jobs, batch_size, workers)
+    log(f"Created {created} applications.")
+    # bulk_create() skips the signals that queue recommendation refreshes.
+    log(f"Created {create_recommendations(seeker_ids, batch_size)} recommendations.")
+    if saved_jobs:
+        log(f"Created {create_saved_jobs(seed, saved_jobs, seekers, weighted_jobs, batch_size, workers)} saved jobs.")
+    if payments:
+        log(f"Created {create_payments(seed, payments, employer_ids, batch_size)} payments.")
+    if reviews:
+        log(f"Created {create_reviews(seed, reviews, seeker_ids, employer_ids, batch_size)} reviews.")
+
+    return {'employer_ids': employer_ids, 'seeker_ids': seeker_ids, 'job_ids': job_ids}
@@ -0,0 +1,59 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import counters
+from .catalog import bump_catalog_version
+from .models import Application, EmployerProfile, Job
+from .search import SEARCH_FIELDS, get_search_backend
+from .skills import sync_job_skills
+from .tasks import enqueue
+
+
+@receiver(post_save, sender=Job)
+def update_job_skill_index(sender, instance, created, update_fields=None, **kwargs):
+    # Saves that don't touch the skill list (e.g. toggling is_active) keep their index rows.
+    if update_fields is not None and 'skills_required' not in update_fields:
+        return
+    sync_job_skills(instance)
+
+
+@receiver(post_save, sender=Job)
+def update_job_recommendations(sender, instance, created, update_fields=None, **kwargs):
+    # Registered after update_job_skill_index, so the JobSkill rows are current.
+    if update_fields is not None and not {'skills_required', 'is_active'} & set(update_fields):
+        return
+    enqueue('refresh_job_recommendations', job_id=instance.pk)
+
+
+@receiver(post_save, sender=Job)
+def update_job_search_index(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(SEARCH_FIELDS):
+        return
+    get_search_backend().index_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_from_search_index(sender, instance, **kwargs):
+    get_search_backend().remove_job(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=EmployerProfile)
+@receiver(post_delete, sender=EmployerProfile)
+def update_catalog_version(sender, **kwargs):
+    bump_catalog_version()
+
+
+@receiver(post_save, sender=Application)
+def count_new_application(sender, instance, created, **kwargs):
+    if created:
+        counters.application_created(instance)
+
+
+@receiver(post_delete, sender=Application)
+def uncount_deleted_application(sender, instance, origin=None, **kwargs):
+    # No point in updating the counters of a job that is being deleted itself.
+    if isinstance(origin, Job):
+        return
+    counters.application_deleted(instance)
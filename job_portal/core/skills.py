@@ -0,0 +1,69 @@
+from .models import JobSeekerProfile, JobSkill, Skill
+
+SKILL_NAME_MAX_LENGTH = 50
+
+
+def parse_skills(raw):
+    """Split a comma separated skill list into unique, normalized names."""
+    names = []
+    for part in (raw or '').split(','):
+        name = part.strip().lower()[:SKILL_NAME_MAX_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def ensure_skills(names):
+    """Create any missing Skill rows and return a name -> id mapping."""
+    names = set(names)
+    if not names:
+        return {}
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    return dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+
+
+def sync_job_skills(job):
+    """Bring the JobSkill rows of a job in line with its skills_required."""
+    wanted = set(parse_skills(job.skills_required))
+    existing = dict(JobSkill.objects.filter(job=job).values_list('skill_name', 'skill_id'))
+
+    # Rows written before JobSkill was linked to Skill are rebuilt as well.
+    stale = {name for name, skill_id in existing.items() if name not in wanted or skill_id is None}
+    if stale:
+        JobSkill.objects.filter(job=job, skill_name__in=stale).delete()
+
+    missing = wanted - (set(existing) - stale)
+    if missing:
+        skill_ids = ensure_skills(missing)
+        JobSkill.objects.bulk_create(
+            [JobSkill(job=job, skill_id=skill_ids[name], skill_name=name) for name in missing],
+            ignore_conflicts=True,
+        )
+
+
+def sync_profile_skills(profile, names, skill_ids=None):
+    """
+    Make ``profile.skills`` exactly ``names``, touching only the rows that change.
+
+    The query count doesn't grow with the number of skills: one read of the
+    current links, one delete, one insert, plus ensure_skills() unless the
+    caller passes a prefetched ``skill_ids`` mapping. Returns whether anything
+    changed.
+    """
+    wanted = set(names)
+    through = JobSeekerProfile.skills.through
+    existing = dict(through.objects.filter(jobseekerprofile=profile).values_list('skill__name', 'skill_id'))
+
+    removed = [skill_id for name, skill_id in existing.items() if name not in wanted]
+    if removed:
+        through.objects.filter(jobseekerprofile=profile, skill_id__in=removed).delete()
+
+    added = wanted - set(existing)
+    if added:
+        if skill_ids is None:
+            skill_ids = ensure_skills(added)
+        through.objects.bulk_create(
+            [through(jobseekerprofile_id=profile.pk, skill_id=skill_ids[name]) for name in added],
+            ignore_conflicts=True,
+        )
+    return bool(removed or added)
@@ -0,0 +1,174 @@
+"""
+A small task queue that uses the Task table as its broker.
+
+Producers call enqueue() inside the transaction that makes the change (the
+views wrap both in transaction.atomic()), so a task exists exactly when the
+change that caused it was committed. ``manage.py run_worker`` claims
+due tasks, runs the registered handler and retries failures with exponential
+backoff. A handler's database writes commit in the same transaction that marks
+its task done, so a retried or requeued task never applies them twice; only
+side effects outside the database (emails) can repeat.
+
+Set TASK_QUEUE_EAGER = True to run handlers inline instead (handy when no worker
+is running, e.g. in development).
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import send_mail, send_mass_mail
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Application, Job, Task
+from .notifications import notify, notify_many
+from .recommendations import refresh_for_job
+
+logger = logging.getLogger(__name__)
+
+RETRY_BASE_DELAY = 10  # seconds; doubles after every failed attempt
+
+_handlers = {}
+
+
+def task(func):
+    """Register ``func`` as a task handler under its function name."""
+    _handlers[func.__name__] = func
+    return func
+
+
+def enqueue(name, key=None, delay=0, max_attempts=5, **payload):
+    """
+    Queue handler ``name`` to be called with ``payload`` as keyword arguments.
+
+    Tasks with the same idempotency ``key`` are only queued once.
+    """
+    if name not in _handlers:
+        raise ValueError(f"Unknown task: {name}")
+    if getattr(settings, 'TASK_QUEUE_EAGER', False):
+        _handlers[name](**payload)
+        return
+    Task.objects.bulk_create(
+        [Task(
+            name=name,
+            payload=payload,
+            idempotency_key=key,
+            max_attempts=max_attempts,
+            run_after=timezone.now() + timedelta(seconds=delay),
+        )],
+        ignore_conflicts=True,
+    )
+
+
+def claim_tasks(limit):
+    """
+    Mark up to ``limit`` due tasks as running and return them.
+
+    Each claim is a conditional UPDATE, so two workers can never both take the
+    same task, on any database. It also stamps updated_at (update() skips
+    auto_now), which requeue_stale_tasks() measures from.
+    """
+    due = Task.objects.filter(status='pending', run_after__lte=timezone.now()).order_by('run_after', 'id')
+    claimed = []
+    for task_id in due.values_list('id', flat=True)[:limit]:
+        if Task.objects.filter(id=task_id, status='pending').update(
+            status='running', attempts=F('attempts') + 1, updated_at=timezone.now(),
+        ):
+            claimed.append(Task.objects.get(id=task_id))
+    return claimed
+
+
+def run_task(task_obj):
+    handler = _handlers.get(task_obj.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for task {task_obj.name!r}")
+        with transaction.atomic():
+            handler(**task_obj.payload)
+            task_obj.status = 'done'
+            task_obj.save(update_fields=['status', 'updated_at'])
+    except Exception:
+        task_obj.last_error = traceback.format_exc()
+        if task_obj.attempts >= task_obj.max_attempts:
+            task_obj.status = 'failed'
+            logger.error("Task %s (%s) failed permanently", task_obj.pk, task_obj.name)
+        else:
+            task_obj.status = 'pending'
+            task_obj.run_after = timezone.now() + timedelta(seconds=RETRY_BASE_DELAY * 2 ** (task_obj.attempts - 1))
+        task_obj.save(update_fields=['status', 'run_after', 'last_error', 'updated_at'])
+        return False
+    return True
+
+
+def requeue_stale_tasks(stale_after):
+    """Put tasks that have been "running" for longer than ``stale_after`` seconds back in the queue."""
+    cutoff = timezone.now() - timedelta(seconds=stale_after)
+    return Task.objects.filter(status='running', updated_at__lt=cutoff).update(
+        status='pending', run_after=timezone.now(), updated_at=timezone.now(),
+    )
+
+
+def _email(user, subject, message):
+    if user.email:
+        send_mail(subject, message, None, [user.email])
+
+
+@task
+def application_submitted(application_id):
+    application = Application.objects.select_related('job__employer__user', 'seeker__user').filter(
+        id=application_id,
+    ).first()
+    if application is None:
+        return
+    employer_user = application.job.employer.user
+    message = f"{application.seeker.user.username} applied to {application.job.title}."
+    notify(employer_user, message)
+    _email(employer_user, f"New application: {application.job.title}", message)
+
+
+@task
+def application_status_changed(application_id, status):
+    application = Application.objects.select_related('job', 'seeker__user').filter(id=application_id).first()
+    if application is None or application.status != status:
+        # Deleted, or changed again since; the newer change has its own task.
+        return
+    seeker_user = application.seeker.user
+    message = f"Your application for {application.job.title} is now: {application.get_status_display()}."
+    notify(seeker_user, message)
+    _email(seeker_user, f"Application update: {application.job.title}", message)
+
+
+@task
+def applications_status_changed(application_ids, status):
+    """application_status_changed() for a bulk update: one notification INSERT and one mail connection."""
+    applications = list(
+        Application.objects.select_related('job', 'seeker__user').filter(id__in=application_ids, status=status)
+    )
+    by_job = {}
+    for application in applications:
+        by_job.setdefault(application.job, []).append(application)
+
+    emails = []
+    for job, job_applications in by_job.items():
+        message = f"Your application for {job.title} is now: {job_applications[0].get_status_display()}."
+        notify_many([application.seeker.user_id for application in job_applications], message)
+        emails.extend(
+            (f"Application update: {job.title}", message, None, [application.seeker.user.email])
+            for application in job_applications if application.seeker.user.email
+        )
+    if emails:
+        send_mass_mail(emails)
+
+
+@task
+def refresh_job_recommendations(job_id):
+    job = Job.objects.filter(id=job_id).first()
+    if job is not None:
+        refresh_for_job(job)
+
+
+@task
+def notify_users(user_ids, message):
+    notify_many(user_ids, message)
@@ -1,3 +1,1123 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import json
+import tempfile
+from datetime import timedelta
+from functools import partial
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.db.models import QuerySet
+from django.http import HttpResponse, QueryDict
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+from django.utils import timezone
+
+from .async_views import gather_queries
+from .events import SUBSCRIBER_QUEUE_SIZE, InProcessBroker, user_channel
+from .expiry import expire_jobs
+from .matching import score_all
+from .metrics import Histogram, exposition
+from .models import (
+    Application, Education, EmployerProfile, Experience, Job, JobRecommendation, JobSeekerProfile, JobSkill,
+    Notification, Skill, Task, User,
+)
+from .notifications import get_unread_count, mark_read, notify_many
+from .nplusone import NPlusOneError, detect_n_plus_one
+from .pagination import encode_cursor, keyset_page
+from .profiles import PROFILE_SECTIONS_LOCAL_TIMEOUT, PROFILE_SECTIONS_TIMEOUT, profile_sections_cache_key
+from .recommendations import TOP_K, refresh_for_seeker, score_jobs_for_seeker
+from .search import get_search_backend
+from .skills import sync_profile_skills
+from .tasks import claim_tasks, enqueue, requeue_stale_tasks
+from .views import DASHBOARD_VISIT_WINDOW
+
+
+def make_employer(username='employer'):
+    user = User.objects.create_user(username, password='pw', role='employer')
+    return EmployerProfile.objects.create(
+        user=user, company_name='Acme', industry='Software', website='https://acme.example',
+        logo='logos/acme.png', description='We make things.',
+    )
+
+
+def make_job(employer, title='Developer', skills='python, django', **fields):
+    fields.setdefault('expiry_date', timezone.localdate() + timedelta(days=30))
+    return Job.objects.create(
+        employer=employer, title=title, description='Build things.', skills_required=skills,
+        location=fields.pop('location', 'Remote'), salary_min=fields.pop('salary_min', 50000),
+        salary_max=fields.pop('salary_max', 80000), job_type=fields.pop('job_type', 'full'), **fields,
+    )
+
+
+def make_seeker(username='seeker', skills=('python',), email=''):
+    user = User.objects.create_user(username, password='pw', role='seeker', email=email)
+    seeker = JobSeekerProfile.objects.create(user=user, phone='555-0100', location='Remote', resume='resumes/cv.pdf')
+    seeker.skills.set([Skill.objects.get_or_create(name=name)[0] for name in skills])
+    return seeker
+
+
+def make_application(job, seeker, **fields):
+    return Application.objects.create(job=job, seeker=seeker, resume='applications/cv.pdf', **fields)
+
+
+def call_command_output(name, **options):
+    stdout = io.StringIO()
+    call_command(name, stdout=stdout, **options)
+    return stdout.getvalue()
+
+
+def job_titles_view(request):
+    # An N+1 on purpose: one job query per application.
+    return HttpResponse(', '.join(application.job.title for application in Application.objects.all()))
+
+
+urlpatterns = [path('job-titles/', job_titles_view)]
+
+
+class TaskQueueTests(TestCase):
+    def test_a_task_is_claimed_once(self):
+        enqueue('notify_users', user_ids=[], message='hi')
+        self.assertEqual(len(claim_tasks(10)), 1)
+        self.assertEqual(claim_tasks(10), [])
+
+    def test_claim_restarts_the_stale_clock(self):
+        # A task that waited in the queue longer than stale_after must not be
+        # taken for a stuck one the moment it is claimed.
+        enqueue('notify_users', user_ids=[], message='hi')
+        Task.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+        [task] = claim_tasks(10)
+
+        self.assertEqual(requeue_stale_tasks(stale_after=60), 0)
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'running')
+
+    def test_stuck_running_task_is_requeued(self):
+        enqueue('notify_users', user_ids=[], message='hi')
+        claim_tasks(10)
+        Task.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(requeue_stale_tasks(stale_after=60), 1)
+        self.assertEqual(len(claim_tasks(10)), 1)
+
+
+class UnreadCountTests(TestCase):
+    def setUp(self):
+        self.user = make_seeker().user
+
+    def notify_from_worker(self, worker_cache):
+        """notify_many() as run by the task worker, a process with its own cache connection."""
+        with mock.patch('core.notifications.cache', worker_cache), self.captureOnCommitCallbacks(execute=True):
+            notify_many([self.user.pk], 'Your application moved on.')
+
+    def test_process_local_cache_is_not_used(self):
+        self.assertEqual(get_unread_count(self.user.pk), 0)
+        self.notify_from_worker(LocMemCache('worker', {}))
+        self.assertEqual(get_unread_count(self.user.pk), 1)
+
+    def test_shared_cache_sees_worker_writes(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location},
+        }):
+            self.assertEqual(get_unread_count(self.user.pk), 0)
+            with self.assertNumQueries(0):
+                self.assertEqual(get_unread_count(self.user.pk), 0)
+
+            self.notify_from_worker(caches.create_connection('default'))
+            self.assertEqual(get_unread_count(self.user.pk), 1)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                mark_read(self.user)
+            self.assertEqual(get_unread_count(self.user.pk), 0)
+
+    def test_count_taken_before_a_write_is_not_served_after_it(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location},
+        }):
+            real_count = QuerySet.count
+
+            def count_then_worker_notifies(queryset):
+                # The worker commits a notification after the COUNT but before it is cached.
+                result = real_count(queryset)
+                self.notify_from_worker(caches.create_connection('default'))
+                return result
+
+            with mock.patch.object(QuerySet, 'count', count_then_worker_notifies):
+                self.assertEqual(get_unread_count(self.user.pk), 0)
+            self.assertEqual(get_unread_count(self.user.pk), 1)
+
+
+class ApplicantExportTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+        self.job = make_job(self.employer)
+        for i, cover_letter in enumerate(['Dear team,\nhire me.', '=HYPERLINK("http://evil.example")']):
+            Application.objects.create(
+                job=self.job, seeker=make_seeker(f'seeker{i}', skills=('python', 'sql')),
+                resume='applications/cv.pdf', cover_letter=cover_letter,
+            )
+        self.url = f'/employer/job/{self.job.pk}/applicants/export/'
+        self.client.force_login(self.employer.user)
+
+    def test_csv(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual([row['username'] for row in rows], ['seeker0', 'seeker1'])
+        self.assertEqual(rows[0]['skills'], 'python, sql')
+        self.assertEqual(rows[0]['cover_letter'], 'Dear team,\nhire me.')
+        # Formulas are neutralized so a spreadsheet shows them as text.
+        self.assertEqual(rows[1]['cover_letter'], '\'=HYPERLINK("http://evil.example")')
+
+    def test_csv_keeps_signed_numbers(self):
+        for phone, exported in (
+            ('+1 (555) 010-0100', '+1 (555) 010-0100'),
+            ('-42', '-42'),
+            ('+1 555 0100 =cmd', "'+1 555 0100 =cmd"),
+            ('-2+SUM(A1:A9)', "'-2+SUM(A1:A9)"),
+        ):
+            with self.subTest(phone=phone):
+                JobSeekerProfile.objects.filter(user__username='seeker0').update(phone=phone)
+                response = self.client.get(self.url)
+                rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+                self.assertEqual(rows[0]['phone'], exported)
+
+    def test_jsonl(self):
+        response = self.client.get(self.url, {'format': 'jsonl'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1]['cover_letter'], '=HYPERLINK("http://evil.example")')
+
+    def test_unknown_format(self):
+        self.assertEqual(self.client.get(self.url, {'format': 'xml'}).status_code, 400)
+
+    def test_other_employers_job(self):
+        self.client.force_login(make_employer('other').user)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class ApplyJobTests(TestCase):
+    def setUp(self):
+        self.job = make_job(make_employer())
+        self.seeker = make_seeker()
+        self.client.force_login(self.seeker.user)
+        self.url = f'/jobs/{self.job.pk}/apply/'
+
+    def test_cover_letter_is_optional(self):
+        self.client.post(self.url)
+        self.assertEqual(Application.objects.get(job=self.job, seeker=self.seeker).cover_letter, '')
+
+    def test_second_application_is_refused(self):
+        self.client.post(self.url, {'cover_letter': 'First.'})
+        response = self.client.post(self.url, {'cover_letter': 'Second.'}, follow=True)
+        self.assertContains(response, "already applied")
+        self.assertEqual(Application.objects.filter(job=self.job, seeker=self.seeker).count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.application_count, 1)
+
+
+class QueryPoolTests(TransactionTestCase):
+    def test_connections_are_reused_between_calls(self):
+        make_job(make_employer())
+        opened = []
+
+        def count_connection(sender, connection, **kwargs):
+            opened.append(connection)
+
+        connection_created.connect(count_connection)
+        try:
+            for _ in range(5):
+                self.assertEqual(async_to_sync(gather_queries)(*[lambda: Job.objects.count()] * 4), [1] * 4)
+        finally:
+            connection_created.disconnect(count_connection)
+        # At most one connection per pool thread, however many calls ran.
+        self.assertLessEqual(len(opened), settings.QUERY_POOL_SIZE)
+
+
+@override_settings(TASK_QUEUE_EAGER=True)
+class RecommendationRefillTests(TestCase):
+    def setUp(self):
+        self.seeker = make_seeker()
+        employer = make_employer()
+        # Equal scores, so the newest TOP_K jobs make the list and the oldest is next in line.
+        self.jobs = [make_job(employer, f'Job {i}', skills=f'python, skill{i}') for i in range(TOP_K + 1)]
+        refresh_for_seeker(self.seeker)
+
+    def stored_job_ids(self):
+        return set(JobRecommendation.objects.filter(seeker=self.seeker).values_list('job_id', flat=True))
+
+    def test_closed_job_is_replaced_by_the_next_best(self):
+        self.assertNotIn(self.jobs[0].pk, self.stored_job_ids())
+        closed = self.jobs[-1]
+        closed.is_active = False
+        closed.save(update_fields=['is_active'])
+
+        self.assertEqual(self.stored_job_ids(), {job.pk for job in self.jobs[:-1]})
+
+    def test_expired_job_is_replaced_by_the_next_best(self):
+        Job.objects.filter(pk=self.jobs[-1].pk).update(expiry_date=timezone.localdate() - timedelta(days=1))
+        self.assertEqual(expire_jobs(), 1)
+
+        self.assertEqual(self.stored_job_ids(), {job.pk for job in self.jobs[:-1]})
+
+
+class EmployerDashboardTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+        self.job = make_job(self.employer)
+        self.client.force_login(self.employer.user)
+
+    def session_writes(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/employer/dashboard/')
+        return [q['sql'] for q in queries if q['sql'].startswith(('UPDATE "django_session"', 'INSERT INTO "django_session"'))]
+
+    def test_reloads_do_not_write_the_session(self):
+        self.assertTrue(self.session_writes())
+        self.assertEqual(self.session_writes(), [])
+
+    def test_new_counts_since_last_visit(self):
+        self.client.get('/employer/dashboard/')
+        Application.objects.create(job=self.job, seeker=make_seeker(), resume='applications/cv.pdf')
+        response = self.client.get('/employer/dashboard/')
+        self.assertEqual(response.context['job_data'][0]['new_count'], 1)
+
+    def test_last_visit_moves_on_after_the_window(self):
+        self.client.get('/employer/dashboard/')
+        session = self.client.session
+        session['employer_dashboard_last_visit'] = (timezone.now() - DASHBOARD_VISIT_WINDOW).isoformat()
+        session.save()
+        self.assertTrue(self.session_writes())
+
+
+class JobApiValidatorTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+        self.job = make_job(self.employer)
+        self.client.force_login(make_seeker().user)
+
+    def test_profile_edit_changes_the_job_detail_etag(self):
+        url = f'/api/v1/jobs/{self.job.id}/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.employer.company_name = 'Acme Holdings'
+        self.employer.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['company'], 'Acme Holdings')
+
+    def assertListingChanges(self, change):
+        etag = self.client.get('/api/v1/jobs/')['ETag']
+        self.assertEqual(self.client.get('/api/v1/jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            change()
+        self.assertEqual(self.client.get('/api/v1/jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_listing_etag_follows_writes(self):
+        def edit_profile():
+            self.employer.company_name = 'Acme Holdings'
+            self.employer.save()
+
+        def expire():
+            Job.objects.filter(pk=self.job.pk).update(expiry_date=timezone.localdate() - timedelta(days=1))
+            expire_jobs()
+
+        for change in (edit_profile, lambda: make_job(self.employer, 'Tester'), expire, self.job.delete):
+            with self.subTest(change=change):
+                self.assertListingChanges(change)
+
+    def test_listing_revalidation_does_not_read_the_jobs(self):
+        etag = self.client.get('/api/v1/jobs/')['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get('/api/v1/jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        tables = ('"core_job"', '"core_employerprofile"')
+        self.assertFalse([q['sql'] for q in queries if any(table in q['sql'] for table in tables)])
+
+
+class SeedPortalCommandTests(TestCase):
+    def test_jobs_without_employers_are_refused(self):
+        with self.assertRaisesMessage(CommandError, "Can't generate jobs without any employers."):
+            call_command('seed_portal', employers=0, stdout=io.StringIO())
+        self.assertFalse(Job.objects.exists())
+
+    def test_small_dataset(self):
+        call_command(
+            'seed_portal', employers=2, seekers=10, jobs=8, applications=20, saved_jobs=5, payments=2, reviews=3,
+            stdout=io.StringIO(),
+        )
+        self.assertEqual(Job.objects.count(), 8)
+        # Never more than asked for; a seeker is never sent twice to one job.
+        self.assertTrue(0 < Application.objects.count() <= 20)
+        self.assertTrue(JobRecommendation.objects.exists())
+
+
+class SparseScoringTests(TestCase):
+    def setUp(self):
+        employer = make_employer()
+        make_job(employer, 'Backend', 'python, django, sql')
+        make_job(employer, 'Data', 'python, sql')
+        make_job(employer, 'Frontend', 'javascript, css')
+        make_job(employer, 'Full stack', 'python, javascript, django, css')
+        make_job(employer, 'Closed', 'python', expiry_date=timezone.localdate() - timedelta(days=1))
+        self.seekers = [
+            make_seeker('pythonista', ('python', 'django')),
+            make_seeker('analyst', ('python', 'sql', 'excel')),
+            make_seeker('designer', ('css',)),
+            make_seeker('newcomer', ('cobol',)),
+        ]
+
+    def sql_scores(self):
+        results = {}
+        for seeker in self.seekers:
+            refresh_for_seeker(seeker)
+            stored = JobRecommendation.objects.filter(seeker=seeker).order_by('-score', '-job_id')
+            results[seeker.pk] = list(stored.values_list('job_id', 'score'))
+        return results
+
+    def assertSameScores(self, sparse, sql):
+        self.assertEqual(sparse.keys(), sql.keys())
+        for seeker_id, expected in sql.items():
+            self.assertEqual([job_id for job_id, score in sparse[seeker_id]], [job_id for job_id, score in expected])
+            for (_, score), (_, expected_score) in zip(sparse[seeker_id], expected):
+                self.assertAlmostEqual(score, expected_score, places=4)
+
+    def test_matches_the_sql_scores(self):
+        self.assertSameScores(dict(score_all()), self.sql_scores())
+
+    def test_matches_across_chunks_and_a_small_top_k(self):
+        sql = {seeker_id: jobs[:2] for seeker_id, jobs in self.sql_scores().items()}
+        self.assertSameScores(dict(score_all(top_k=2, chunk_size=3)), sql)
+
+
+class KeysetPaginationTests(TestCase):
+    ordering = ('-created_at', '-id')
+
+    def setUp(self):
+        employer = make_employer()
+        self.jobs = [make_job(employer, f'Job {i}') for i in range(5)]
+
+    def walk(self, page_size):
+        pages, cursor = [], None
+        while True:
+            page = keyset_page(Job.objects.all(), self.ordering, cursor=cursor, page_size=page_size)
+            pages.append([job.pk for job in page])
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    def test_pages_cover_every_row_once(self):
+        pages = self.walk(2)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), [job.pk for job in reversed(self.jobs)])
+
+    def test_no_cursor_when_the_last_page_is_exactly_full(self):
+        self.assertEqual(len(self.walk(5)), 1)
+        pages = self.walk(1)
+        self.assertEqual([len(page) for page in pages], [1] * 5)
+
+    def test_ties_on_the_leading_field_fall_back_to_the_id(self):
+        Job.objects.update(created_at=timezone.now())
+        self.assertEqual(sum(self.walk(2), []), sorted((job.pk for job in self.jobs), reverse=True))
+
+    def test_empty_result(self):
+        page = keyset_page(Job.objects.none(), self.ordering)
+        self.assertEqual(list(page), [])
+        self.assertIsNone(page.next_cursor)
+
+    def test_cursor_after_the_last_row(self):
+        last = min(self.jobs, key=lambda job: (job.created_at, job.pk))
+        page = keyset_page(Job.objects.all(), self.ordering, cursor=encode_cursor([last.created_at, last.pk]))
+        self.assertEqual(list(page), [])
+        self.assertFalse(page.has_next)
+
+    def test_malformed_cursors_start_from_the_top(self):
+        first_page = [job.pk for job in keyset_page(Job.objects.all(), self.ordering, page_size=2)]
+        for cursor in ('not base64 !', encode_cursor(['yesterday', 1]), encode_cursor([1]), encode_cursor({'id': 1})):
+            with self.subTest(cursor=cursor):
+                page = keyset_page(Job.objects.all(), self.ordering, cursor=cursor, page_size=2)
+                self.assertEqual([job.pk for job in page], first_page)
+
+
+@override_settings(ROOT_URLCONF='core.tests', NPLUSONE_ENABLED=True, NPLUSONE_RAISE=True, NPLUSONE_THRESHOLD=3)
+class NPlusOneTests(TestCase):
+    def setUp(self):
+        employer = make_employer()
+        seeker = make_seeker()
+        for i in range(3):
+            make_application(make_job(employer, f'Job {i}'), seeker)
+
+    def test_raise_mode_fails_the_request(self):
+        with self.assertRaises(NPlusOneError):
+            self.client.get('/job-titles/')
+
+    def test_log_mode_reports_the_origin(self):
+        with override_settings(NPLUSONE_RAISE=False), self.assertLogs('core.nplusone', 'WARNING') as logs:
+            self.assertEqual(self.client.get('/job-titles/').status_code, 200)
+        self.assertIn('core/tests.py', logs.output[0])
+
+    def test_disabled(self):
+        with override_settings(NPLUSONE_ENABLED=False):
+            self.assertEqual(self.client.get('/job-titles/').status_code, 200)
+
+    def test_below_the_threshold(self):
+        with override_settings(NPLUSONE_THRESHOLD=4):
+            self.assertEqual(self.client.get('/job-titles/').status_code, 200)
+
+    def test_detect_n_plus_one_block(self):
+        with self.assertRaises(NPlusOneError):
+            with detect_n_plus_one():
+                [application.job.title for application in Application.objects.all()]
+        with detect_n_plus_one():
+            [application.job.title for application in Application.objects.select_related('job')]
+
+
+class CoreViewsDataMixin:
+    """Enough rows per list on every page that an N+1 shows up."""
+
+    def create_portal(self):
+        self.employer = make_employer()
+        self.jobs = [make_job(self.employer, f'Job {i}', 'python, django, sql') for i in range(4)]
+        self.seeker = make_seeker(skills=('python', 'sql'))
+        for i, job in enumerate(self.jobs):
+            make_application(job, make_seeker(f'applicant-{i}'))
+            make_application(job, make_seeker(f'other-applicant-{i}'), status='interview')
+        for job in self.jobs[:3]:
+            make_application(job, self.seeker)
+        refresh_for_seeker(self.seeker)
+        notify_many([self.seeker.user_id] * 3, 'Update.')
+
+    def assertPagesLoad(self, user, urls):
+        self.client.force_login(user)
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertLess(self.client.get(url).status_code, 400)
+
+
+@override_settings(NPLUSONE_ENABLED=True, NPLUSONE_RAISE=True)
+class CoreViewsNPlusOneTests(CoreViewsDataMixin, TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_portal()
+
+    def test_seeker_pages(self):
+        self.assertPagesLoad(self.seeker.user, [
+            '/', '/jobs/', '/jobs/?q=python', '/seeker/dashboard/', '/seeker/profile/', '/notifications/',
+        ])
+
+    def test_employer_pages(self):
+        self.assertPagesLoad(self.employer.user, [
+            '/employer/dashboard/', '/employer/jobs/', f'/employer/job/{self.jobs[0].pk}/applicants/',
+        ])
+
+
+@override_settings(NPLUSONE_ENABLED=True, NPLUSONE_RAISE=True)
+class AsyncViewsNPlusOneTests(CoreViewsDataMixin, TransactionTestCase):
+    # The query pool's threads have connections of their own, so the data must be committed.
+    def setUp(self):
+        self.create_portal()
+
+    def test_seeker_pages(self):
+        self.assertPagesLoad(self.seeker.user, ['/async/jobs/', '/async/seeker/dashboard/'])
+
+
+class BulkStatusUpdateTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+        self.job = make_job(self.employer)
+        self.applications = [make_application(self.job, make_seeker(f'seeker-{i}')) for i in range(3)]
+        self.client.force_login(self.employer.user)
+
+    def update(self, status, applications, job=None):
+        url = f'/employer/job/{(job or self.job).pk}/applicants/update/'
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(url, {'status': status, 'application_ids': [app.pk for app in applications]})
+
+    def test_moves_the_counters_and_queues_one_task(self):
+        self.update('interview', self.applications[:2])
+        self.update('hired', self.applications[1:])
+
+        self.job.refresh_from_db()
+        counts = (self.job.application_count, self.job.applied_count, self.job.interview_count, self.job.hired_count)
+        self.assertEqual(counts, (3, 0, 1, 2))
+        tasks = Task.objects.filter(name='applications_status_changed').order_by('id')
+        self.assertEqual(
+            [sorted(task.payload['application_ids']) for task in tasks],
+            [sorted(app.pk for app in self.applications[:2]), sorted(app.pk for app in self.applications[1:])],
+        )
+
+    def test_unchanged_applications_are_skipped(self):
+        self.update('interview', self.applications[:1])
+        self.update('interview', self.applications[:1])
+        self.assertEqual(Task.objects.filter(name='applications_status_changed').count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.interview_count, 1)
+
+    def test_other_jobs_applications_are_ignored(self):
+        other_job = make_job(self.employer, 'Other')
+        other = make_application(other_job, make_seeker('other'))
+        self.update('rejected', [self.applications[0], other])
+        other.refresh_from_db()
+        self.assertEqual(other.status, 'applied')
+        self.assertEqual(Application.objects.filter(status='rejected').count(), 1)
+
+    def test_only_the_jobs_employer(self):
+        self.client.force_login(make_employer('someone-else').user)
+        self.assertEqual(self.update('hired', self.applications).status_code, 404)
+        self.assertFalse(Application.objects.exclude(status='applied').exists())
+
+
+# The test runner has already set up the test environment and database; the
+# benchmark runs against them instead of creating its own.
+@mock.patch('core.management.commands.benchmark.setup_test_environment', mock.Mock())
+@mock.patch('core.management.commands.benchmark.teardown_test_environment', mock.Mock())
+@mock.patch.object(connection.creation, 'create_test_db', mock.Mock())
+@mock.patch.object(connection.creation, 'destroy_test_db', mock.Mock())
+class BenchmarkCommandTests(TransactionTestCase):
+    scale = {'employers': 2, 'seekers': 6, 'jobs': 6, 'applications': 10, 'requests': 2, 'warmup': 1}
+
+    def test_results_file(self):
+        with tempfile.NamedTemporaryFile('r', suffix='.json') as output:
+            call_command('benchmark', **self.scale, output=output.name, stdout=io.StringIO(), stderr=io.StringIO())
+            results = json.load(output)
+
+        seeded = ('employers', 'seekers', 'jobs', 'applications')
+        self.assertEqual(results['scale'], {name: self.scale[name] for name in seeded})
+        self.assertEqual(results['database'], connection.vendor)
+        self.assertEqual(set(results['views']), {
+            'job_list', 'job_list_search', 'seeker_dashboard', 'employer_dashboard', 'view_applicants', 'apply_job',
+            'job_list_async', 'seeker_dashboard_async',
+        })
+        for name, summary in results['views'].items():
+            with self.subTest(view=name):
+                self.assertEqual(summary['requests'], 2)
+                self.assertLessEqual(summary['p50_ms'], summary['p99_ms'])
+                self.assertLessEqual(summary['p99_ms'], summary['max_ms'])
+                self.assertGreater(summary['queries_median'], 0)
+
+    def test_compare(self):
+        baseline = {'views': {'job_list': {'p50_ms': 1.0, 'p95_ms': 2.0, 'queries_median': 0}}}
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as previous:
+            json.dump(baseline, previous)
+            previous.flush()
+            stdout = io.StringIO()
+            call_command('benchmark', **self.scale, compare=previous.name, stdout=stdout, stderr=io.StringIO())
+
+        table = stdout.getvalue().split('\nview ', 1)[1].splitlines()
+        # Only the views present in both runs are compared; a zero baseline has no percentage.
+        self.assertEqual(len(table), 2)
+        self.assertTrue(table[1].startswith('job_list '))
+        self.assertIn('(n/a)', table[1])
+
+    def test_missing_compare_file(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark', **self.scale, compare='/nonexistent/results.json', stdout=io.StringIO())
+
+
+class JobCounterTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+        self.job = make_job(self.employer)
+        self.seekers = [make_seeker(f'seeker-{i}') for i in range(3)]
+        self.applications = [make_application(self.job, seeker) for seeker in self.seekers]
+        self.client.force_login(self.employer.user)
+
+    def counts(self):
+        self.job.refresh_from_db()
+        return {
+            field: getattr(self.job, field)
+            for field in ('application_count', 'applied_count', 'interview_count', 'rejected_count', 'hired_count')
+        }
+
+    def set_status(self, application, status):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/employer/applicant/{application.pk}/update/', {'status': status})
+
+    def test_create_status_change_and_delete(self):
+        self.set_status(self.applications[0], 'interview')
+        self.set_status(self.applications[0], 'hired')
+        self.set_status(self.applications[1], 'rejected')
+        self.assertEqual(self.counts(), {
+            'application_count': 3, 'applied_count': 1, 'interview_count': 0, 'rejected_count': 1, 'hired_count': 1,
+        })
+
+        Application.objects.get(pk=self.applications[1].pk).delete()
+        self.seekers[0].user.delete()
+        self.assertEqual(self.counts(), {
+            'application_count': 1, 'applied_count': 1, 'interview_count': 0, 'rejected_count': 0, 'hired_count': 0,
+        })
+        self.assertEqual(call_command_output('reconcile_job_counters'), "Checked 1 jobs, repaired 0.\n")
+
+    def test_drifted_counters_do_not_block_deletes_or_status_changes(self):
+        Job.objects.filter(pk=self.job.pk).update(application_count=0, applied_count=0)
+
+        self.set_status(self.applications[0], 'interview')
+        Application.objects.get(pk=self.applications[1].pk).delete()
+        self.seekers[2].user.delete()
+        self.assertEqual(Application.objects.get().status, 'interview')
+        self.assertEqual(self.counts()['applied_count'], 0)
+        self.assertEqual(self.counts()['application_count'], 0)
+
+        self.assertEqual(call_command_output('reconcile_job_counters'), "Checked 1 jobs, repaired 1.\n")
+        self.assertEqual(self.counts(), {
+            'application_count': 1, 'applied_count': 0, 'interview_count': 1, 'rejected_count': 0, 'hired_count': 0,
+        })
+
+
+class ProfileSectionsCacheTests(TestCase):
+    def setUp(self):
+        self.seeker = make_seeker()
+        self.experience = Experience.objects.create(
+            seeker=self.seeker, company='Initech', position='Developer', start_date='2020-01-01',
+        )
+        self.education = Education.objects.create(
+            seeker=self.seeker, institute='State University', degree='BSc', start_year=2015, end_year=2019,
+        )
+        self.client.force_login(self.seeker.user)
+        # The test database reuses ids; entries of earlier tests would match them.
+        caches['default'].clear()
+
+    def profile(self):
+        return self.client.get('/seeker/profile/').content.decode()
+
+    def test_sections_are_served_from_the_cache(self):
+        self.profile()
+        # Rows written behind the views' back don't show until the entry goes.
+        Experience.objects.filter(pk=self.experience.pk).update(company='Globex')
+        self.assertIn('Initech', self.profile())
+
+    def test_edits_invalidate_the_sections(self):
+        self.assertIn('Initech', self.profile())
+        self.client.post(f'/seeker/experience/{self.experience.pk}/edit/', {
+            'company': 'Globex', 'position': 'Developer', 'start_date': '2020-01-01', 'end_date': '',
+        })
+        self.assertIn('Globex', self.profile())
+
+        self.client.post(f'/seeker/education/{self.education.pk}/edit/', {
+            'institute': 'State University', 'degree': 'MSc', 'start_year': 2019, 'end_year': 2021,
+        })
+        self.assertIn('MSc at State University', self.profile())
+
+        self.client.post('/seeker/add-education/', {
+            'institute': 'Night School', 'degree': 'Diploma', 'start_year': 2022, 'end_year': 2023,
+        })
+        self.client.get(f'/seeker/experience/{self.experience.pk}/delete/')
+        sections = self.profile()
+        self.assertIn('Night School', sections)
+        self.assertNotIn('Globex', sections)
+
+    def test_short_timeout_with_a_process_local_cache(self):
+        with tempfile.TemporaryDirectory() as location:
+            for backend, timeout in (
+                ('django.core.cache.backends.locmem.LocMemCache', PROFILE_SECTIONS_LOCAL_TIMEOUT),
+                ('django.core.cache.backends.filebased.FileBasedCache', PROFILE_SECTIONS_TIMEOUT),
+            ):
+                with self.subTest(backend=backend), override_settings(CACHES={
+                    'default': {'BACKEND': backend, 'LOCATION': location},
+                }), mock.patch('core.profiles.cache') as cache:
+                    cache.get.return_value = None
+                    self.profile()
+                    cache.set.assert_called_once_with(profile_sections_cache_key(self.seeker.pk), mock.ANY, timeout)
+
+
+class ViewApplicantsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = make_employer()
+        cls.job = make_job(cls.employer)
+        noon = timezone.localtime().replace(hour=12, minute=0, second=0, microsecond=0)
+        cls.applications = {}
+        # Newest first.
+        for i, status in enumerate(['rejected', 'hired', 'interview', 'applied', 'interview', 'applied']):
+            app = make_application(cls.job, make_seeker(f'seeker-{i}'), status=status, cover_letter=f'Letter {i}')
+            Application.objects.filter(pk=app.pk).update(applied_at=noon - timedelta(days=i))
+            cls.applications[i] = app
+        cls.today = noon.date()
+
+    def setUp(self):
+        self.url = f'/employer/job/{self.job.pk}/applicants/'
+        self.client.force_login(self.employer.user)
+
+    def day(self, days_ago):
+        return (self.today - timedelta(days=days_ago)).isoformat()
+
+    def listed(self, **params):
+        return [app.pk for app in self.client.get(self.url, params).context['applications']]
+
+    def ids(self, *indexes):
+        return [self.applications[i].pk for i in indexes]
+
+    def test_sorts(self):
+        self.assertEqual(self.listed(), self.ids(0, 1, 2, 3, 4, 5))
+        self.assertEqual(self.listed(sort='oldest'), self.ids(5, 4, 3, 2, 1, 0))
+        # Pipeline order, oldest first within a status.
+        self.assertEqual(self.listed(sort='status'), self.ids(5, 3, 4, 2, 1, 0))
+
+    def test_status_sort_across_pages(self):
+        pages, params = [], {'sort': 'status'}
+        with mock.patch('core.views.keyset_page', partial(keyset_page, page_size=4)):
+            while True:
+                response = self.client.get(self.url, params)
+                pages.append([app.pk for app in response.context['applications']])
+                if not response.context['next_query_string']:
+                    break
+                params = dict(QueryDict(response.context['next_query_string']).items())
+        self.assertEqual(pages, [self.ids(5, 3, 4, 2), self.ids(1, 0)])
+
+    def test_filters(self):
+        self.assertEqual(self.listed(status='interview'), self.ids(2, 4))
+        self.assertEqual(self.listed(applied_from=self.day(2), applied_to=self.day(1)), self.ids(1, 2))
+        self.assertEqual(self.listed(status='applied', applied_to=self.day(4)), self.ids(5))
+
+    def test_malformed_params_are_ignored(self):
+        everyone = self.ids(0, 1, 2, 3, 4, 5)
+        for params in (
+            {'applied_from': '2024-13-45'}, {'applied_to': 'yesterday'}, {'status': 'promoted'}, {'sort': 'salary'},
+            {'cursor': 'garbage'},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.listed(**params), everyone)
+
+    def test_cover_letter_fragment(self):
+        url = f'/employer/applicant/{self.applications[0].pk}/cover-letter/'
+        self.assertContains(self.client.get(url), 'Letter 0')
+
+        self.client.force_login(make_employer('other').user)
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.client.force_login(self.applications[0].seeker.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_other_employers_job(self):
+        self.client.force_login(make_employer('other').user)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class JobSearchTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+        self.backend = get_search_backend()
+
+    def search(self, query):
+        jobs = self.backend.search(Job.objects.all(), query).order_by('-search_rank', '-id')
+        return list(jobs.values_list('id', flat=True))
+
+    def test_index_follows_saves_and_deletes(self):
+        job = make_job(self.employer, 'Kotlin developer')
+        self.assertEqual(self.search('kotlin'), [job.pk])
+
+        job.title = 'Rust developer'
+        job.save()
+        self.assertEqual(self.search('kotlin'), [])
+        self.assertEqual(self.search('rust'), [job.pk])
+
+        job.delete()
+        self.assertEqual(self.search('rust'), [])
+
+    def test_title_matches_rank_first(self):
+        in_description = make_job(self.employer, 'Mobile developer')
+        Job.objects.filter(pk=in_description.pk).update(description='Android apps, mostly in Kotlin.')
+        self.backend.index_job(Job.objects.get(pk=in_description.pk))
+        in_title = make_job(self.employer, 'Kotlin engineer', skills='java')
+        in_skills = make_job(self.employer, 'Backend engineer', skills='kotlin, sql')
+        make_job(self.employer, 'Designer', skills='figma')
+
+        self.assertEqual(self.search('kotlin'), [in_title.pk, in_skills.pk, in_description.pk])
+
+    def test_query_syntax_is_not_interpreted(self):
+        job = make_job(self.employer, 'Python developer')
+        for query in ('"python', 'python*', '(python', 'python -', 'developer: python^'):
+            with self.subTest(query=query):
+                self.assertEqual(self.search(query), [job.pk])
+        # Words only: "OR" is one more term to match, not an operator.
+        self.assertEqual(self.search('python OR rust'), [])
+
+    def test_query_without_words(self):
+        make_job(self.employer, 'Python developer')
+        self.assertEqual(self.search('!!'), [])
+        self.client.force_login(make_seeker().user)
+        self.assertEqual(list(self.client.get('/jobs/', {'q': '!!'}).context['jobs']), [])
+        response = self.client.get('/api/v1/jobs/search/', {'q': '!!'})
+        self.assertEqual(json.loads(response.content)['results'], [])
+
+    def test_job_list_ranks_results(self):
+        other = make_job(self.employer, 'Data analyst', skills='python, sql')
+        best = make_job(self.employer, 'Python developer', skills='python')
+        self.client.force_login(make_seeker().user)
+        response = self.client.get('/jobs/', {'q': 'python'})
+        self.assertEqual([job.pk for job in response.context['jobs']], [best.pk, other.pk])
+
+
+class ProfileSkillSyncTests(TestCase):
+    def setUp(self):
+        self.seeker = make_seeker(skills=('python', 'sql'))
+
+    def skills(self, seeker=None):
+        return sorted((seeker or self.seeker).skills.values_list('name', flat=True))
+
+    def sync_queries(self, names):
+        with CaptureQueriesContext(connection) as queries:
+            sync_profile_skills(self.seeker, names)
+        return len(queries)
+
+    def test_queries_do_not_grow_with_the_skills(self):
+        few = self.sync_queries(['python', 'go', 'rust'])
+        self.assertEqual(self.skills(), ['go', 'python', 'rust'])
+        many = self.sync_queries([f'skill-{i}' for i in range(40)])
+        self.assertEqual(len(self.skills()), 40)
+        self.assertEqual(few, many)
+
+    def test_unchanged_skills_only_read(self):
+        with self.assertNumQueries(1):
+            self.assertFalse(sync_profile_skills(self.seeker, ['sql', 'python']))
+
+    def test_import_command(self):
+        make_seeker('second', skills=())
+        rows = [
+            ['username', 'phone', 'location', 'bio', 'skills'],
+            ['seeker', '555-0199', 'Berlin', '', 'Python, Go'],
+            ['second', '555-0142', 'Lisbon', 'Hi', ' sql,SQL , excel'],
+            ['missing', '', '', '', 'java'],
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='') as f:
+            csv.writer(f).writerows(rows)
+            f.flush()
+            stderr = io.StringIO()
+            call_command('import_seeker_profiles', f.name, stdout=io.StringIO(), stderr=stderr)
+
+        self.assertEqual(self.skills(), ['go', 'python'])
+        second = JobSeekerProfile.objects.get(user__username='second')
+        self.assertEqual((second.location, self.skills(second)), ('Lisbon', ['excel', 'sql']))
+        self.assertIn("'missing'", stderr.getvalue())
+
+    def test_import_queries_do_not_grow_with_the_skills(self):
+        def import_queries(skills):
+            with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='') as f:
+                csv.writer(f).writerows([['username', 'skills'], ['seeker', skills]])
+                f.flush()
+                with CaptureQueriesContext(connection) as queries:
+                    call_command('import_seeker_profiles', f.name, stdout=io.StringIO())
+            return len(queries)
+
+        self.assertEqual(
+            import_queries('go, rust'),
+            import_queries(', '.join(f'skill-{i}' for i in range(40))),
+        )
+
+
+class ApplicationStatusStreamTests(TestCase):
+    url = '/async/seeker/applications/stream/'
+
+    def setUp(self):
+        self.employer = make_employer()
+        self.seeker = make_seeker()
+        self.application = make_application(make_job(self.employer), self.seeker)
+        self.async_client.force_login(self.seeker.user)
+
+    def update_status(self, status):
+        self.client.force_login(self.employer.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/employer/applicant/{self.application.pk}/update/', {'status': status})
+
+    async def test_status_changes_reach_the_stream(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        events = aiter(response.streaming_content)
+        try:
+            self.assertEqual(await anext(events), b'retry: 3000\n\n')
+            await sync_to_async(self.update_status)('interview')
+            event = await asyncio.wait_for(anext(events), timeout=5)
+        finally:
+            await events.aclose()
+
+        name, data = event.decode().rstrip('\n').split('\n')
+        self.assertEqual(name, 'event: application-status')
+        self.assertEqual(json.loads(data.removeprefix('data: ')), {
+            'application_id': self.application.pk, 'job_id': self.application.job_id, 'job_title': 'Developer',
+            'status': 'interview', 'status_display': 'Interview Scheduled',
+        })
+
+    async def test_messages_only_reach_their_channel(self):
+        broker = InProcessBroker()
+        async with broker.subscribe(user_channel(1)) as mine, broker.subscribe(user_channel(2)) as theirs:
+            # Publishers are sync code, usually on another thread.
+            await sync_to_async(broker.publish, thread_sensitive=False)(user_channel(1), {'n': 1})
+            self.assertEqual(await asyncio.wait_for(mine.get(), timeout=5), {'n': 1})
+            self.assertTrue(theirs.empty())
+        broker.publish(user_channel(1), {'n': 2})  # No subscribers left; dropped.
+
+    async def test_slow_subscribers_lose_the_oldest_messages(self):
+        broker = InProcessBroker()
+        async with broker.subscribe('channel') as queue:
+            for n in range(SUBSCRIBER_QUEUE_SIZE + 5):
+                broker.publish('channel', n)
+            await asyncio.sleep(0)
+            self.assertEqual(queue.qsize(), SUBSCRIBER_QUEUE_SIZE)
+            self.assertEqual(queue.get_nowait(), 5)
+
+    def test_wsgi_and_non_seekers(self):
+        self.client.force_login(self.seeker.user)
+        self.assertEqual(self.client.get(self.url).status_code, 204)
+        self.client.force_login(self.employer.user)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class MetricsTests(TestCase):
+    def sample_count(self, histogram, view):
+        prefix = f'{histogram}_count{{view="{view}"}} '
+        for line in exposition().splitlines():
+            if line.startswith(prefix):
+                return float(line[len(prefix):])
+        return 0
+
+    def test_histogram_exposition(self):
+        histogram = Histogram('test_latency_seconds', "Test latency.", (0.1, 1))
+        for value in (0.05, 0.5, 0.5, 3):
+            histogram.observe('core:view"1', value)
+        self.assertEqual(histogram.expose().splitlines(), [
+            '# HELP test_latency_seconds Test latency.',
+            '# TYPE test_latency_seconds histogram',
+            'test_latency_seconds_bucket{view="core:view\\"1",le="0.1"} 1',
+            'test_latency_seconds_bucket{view="core:view\\"1",le="1"} 3',
+            'test_latency_seconds_bucket{view="core:view\\"1",le="+Inf"} 4',
+            'test_latency_seconds_sum{view="core:view\\"1"} 4.05',
+            'test_latency_seconds_count{view="core:view\\"1"} 4',
+        ])
+
+    def test_endpoint_is_staff_only(self):
+        self.assertEqual(self.client.get('/metrics/').status_code, 403)
+        self.client.force_login(make_seeker().user)
+        self.assertEqual(self.client.get('/metrics/').status_code, 403)
+
+        self.client.force_login(User.objects.create_user('ops', password='pw', role='admin', is_staff=True))
+        response = self.client.get('/metrics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        self.assertIn(b'# TYPE job_portal_request_duration_seconds histogram', response.content)
+
+    @override_settings(METRICS_ENABLED=True, METRICS_SAMPLE_RATE=1.0)
+    def test_middleware_records_each_view(self):
+        make_job(make_employer())
+        self.client.force_login(make_seeker().user)
+        before = {name: self.sample_count(name, 'job-list') for name in (
+            'job_portal_request_duration_seconds', 'job_portal_request_queries', 'job_portal_response_size_bytes',
+        )}
+        self.client.get('/jobs/')
+        self.client.get('/jobs/')
+        for name, count in before.items():
+            with self.subTest(histogram=name):
+                self.assertEqual(self.sample_count(name, 'job-list'), count + 2)
+
+    @override_settings(METRICS_ENABLED=True, METRICS_SAMPLE_RATE=0.0)
+    def test_unsampled_requests_are_not_recorded(self):
+        self.client.force_login(make_seeker().user)
+        before = self.sample_count('job_portal_request_duration_seconds', 'job-list')
+        self.client.get('/jobs/')
+        self.assertEqual(self.sample_count('job_portal_request_duration_seconds', 'job-list'), before)
+
+
+class JobSkillIndexTests(TestCase):
+    def setUp(self):
+        self.employer = make_employer()
+
+    def index_rows(self, job):
+        return sorted(JobSkill.objects.filter(job=job).values_list('skill_name', 'skill__name'))
+
+    def test_rows_follow_skills_required(self):
+        job = make_job(self.employer, skills=' Python,DJANGO , python,')
+        self.assertEqual(self.index_rows(job), [('django', 'django'), ('python', 'python')])
+
+        job.skills_required = 'python, rust'
+        job.save()
+        self.assertEqual(self.index_rows(job), [('python', 'python'), ('rust', 'rust')])
+
+        # Saves that leave the skills alone don't touch the index.
+        with CaptureQueriesContext(connection) as queries:
+            job.save(update_fields=['is_active'])
+        self.assertFalse([q['sql'] for q in queries if 'core_jobskill' in q['sql']])
+
+    def test_scores_come_from_the_index(self):
+        seeker = make_seeker(skills=('python', 'sql'))
+        half = make_job(self.employer, 'Half', 'python, django')
+        full = make_job(self.employer, 'Full', 'python, sql')
+        make_job(self.employer, 'None', 'java')
+        make_job(self.employer, 'Expired', 'python', expiry_date=timezone.localdate() - timedelta(days=1))
+        make_job(self.employer, 'Closed', 'sql', is_active=False)
+
+        scores = dict(score_jobs_for_seeker(seeker).values_list('id', 'score'))
+        self.assertEqual(scores, {half.pk: 50.0, full.pk: 100.0})
+
+    def test_dashboard_queries_do_not_grow_with_the_jobs(self):
+        seeker = make_seeker(skills=('python',))
+        self.client.force_login(seeker.user)
+
+        def dashboard_queries():
+            refresh_for_seeker(seeker)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/seeker/dashboard/')
+            return len(queries), response
+
+        make_job(self.employer, 'First', 'python')
+        few, _ = dashboard_queries()
+        for i in range(10):
+            make_job(self.employer, f'Job {i}', 'python, go')
+        many, response = dashboard_queries()
+        self.assertEqual(few, many)
+        self.assertEqual([score for job, score in response.context['recommended_jobs']], [100.0] + [50.0] * 4)
+
+
+class BackfillJobSkillsTests(TestCase):
+    def setUp(self):
+        employer = make_employer()
+        self.jobs = [make_job(employer, f'Job {i}', f'python, skill-{i}') for i in range(5)]
+        JobSkill.objects.all().delete()
+
+    def indexed_jobs(self):
+        return sorted(set(JobSkill.objects.values_list('job_id', flat=True)))
+
+    def test_rebuilds_every_job_in_batches(self):
+        output = call_command_output('backfill_job_skills', batch_size=2)
+        self.assertEqual(self.indexed_jobs(), [job.pk for job in self.jobs])
+        self.assertEqual(
+            sorted(JobSkill.objects.filter(job=self.jobs[3]).values_list('skill__name', flat=True)),
+            ['python', 'skill-3'],
+        )
+        self.assertIn(f"Backfilled 4 jobs (resume with --start-after {self.jobs[3].pk})", output)
+        self.assertIn("Done. 5 jobs backfilled.", output)
+
+    def test_resumes_after_a_job(self):
+        call_command_output('backfill_job_skills', start_after=self.jobs[2].pk)
+        self.assertEqual(self.indexed_jobs(), [self.jobs[3].pk, self.jobs[4].pk])
+
+    def test_replaces_stale_rows(self):
+        JobSkill.objects.create(job=self.jobs[0], skill_name='cobol')
+        call_command_output('backfill_job_skills')
+        self.assertEqual(
+            sorted(JobSkill.objects.filter(job=self.jobs[0]).values_list('skill_name', 'skill__name')),
+            [('python', 'python'), ('skill-0', 'skill-0')],
+        )
+
+
+class IndexPlanTests(TestCase):
+    def test_hot_queries_use_indexes(self):
+        output = call_command_output('explain_queries', strict=True)
+        self.assertNotIn('FULL SCAN', output)
+        self.assertEqual(output.count('indexed '), 13)
+
+    def test_full_scan_is_reported(self):
+        # Dropping an index mid-test doesn't work here: SQLite keeps the cached
+        # EXPLAIN plans of earlier tests. Filter on a column with no index instead.
+        querysets = {'jobs by title': Job.objects.filter(title='Engineer')}
+        with mock.patch('core.management.commands.explain_queries.hot_querysets', return_value=querysets):
+            output = call_command_output('explain_queries')
+            self.assertIn('FULL SCAN  jobs by title', output)
+            with self.assertRaisesMessage(CommandError, "1 queries do a full table scan: jobs by title"):
+                call_command_output('explain_queries', strict=True)
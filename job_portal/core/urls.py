@@ -1,5 +1,7 @@
 from django.urls import path
 from .views import *
+from .api import api_job_detail, api_job_list, api_job_search
+from .async_views import application_status_stream, job_list_async, seeker_dashboard_async
 
 
 urlpatterns = [
@@ -15,9 +17,15 @@ urlpatterns = [
     path('employer/jobs/<int:job_id>/delete/', delete_job, name='delete-job'),
     path('jobs/', job_list, name='job-list'),
     path('jobs/<int:job_id>/apply/', apply_job, name='apply-job'),
+    path('async/jobs/', job_list_async, name='job-list-async'),
     path('seeker/dashboard/', seeker_dashboard, name='seeker-dashboard'),
+    path('async/seeker/dashboard/', seeker_dashboard_async, name='seeker-dashboard-async'),
+    path('async/seeker/applications/stream/', application_status_stream, name='application-status-stream'),
     path('employer/dashboard/', employer_dashboard, name='employer-dashboard'),
     path('employer/job/<int:job_id>/applicants/', view_applicants, name='view-applicants'),
+    path('employer/job/<int:job_id>/applicants/update/', bulk_update_applicant_status, name='bulk-update-applicant-status'),
+    path('employer/job/<int:job_id>/applicants/export/', export_applicants, name='export-applicants'),
+    path('employer/applicant/<int:application_id>/cover-letter/', applicant_cover_letter, name='applicant-cover-letter'),
     path('employer/applicant/<int:application_id>/update/', update_applicant_status, name='update-applicant-status'),
     path('seeker/add-experience/', add_experience, name='add-experience'),
     path('seeker/add-education/', add_education, name='add-education'),
@@ -36,5 +44,12 @@ urlpatterns = [
     path('subscription/', subscription_plans, name='subscription-plans'),
     path('subscription/purchase/<int:plan_id>/', purchase_subscription, name='purchase-subscription'),
     path('payments/', payment_history, name='payment-history'),
+    path('notifications/', notification_list, name='notifications'),
+    path('notifications/read/', mark_notifications_read, name='mark-notifications-read'),
+    path('notifications/unread-count/', unread_notification_count, name='unread-notification-count'),
+    path('metrics/', prometheus_metrics, name='metrics'),
+    path('api/v1/jobs/', api_job_list, name='api-job-list'),
+    path('api/v1/jobs/search/', api_job_search, name='api-job-search'),
+    path('api/v1/jobs/<int:job_id>/', api_job_detail, name='api-job-detail'),
 
 ]
\ No newline at end of file
@@ -1,3 +1,10 @@
+import csv
+import datetime
+import json
+import re
+from itertools import islice
+
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
 from .forms import *
 from django.contrib.auth.views import LoginView,LogoutView
@@ -5,8 +12,25 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.auth import login
 from .models import *
-from django.db.models import Q
-from django.views.decorators.http import require_POST
+from django.db import IntegrityError, transaction
+from django.db.models import BooleanField, Case, Count, ExpressionWrapper, IntegerField, Q, Value, When
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseForbidden, QueryDict, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.http import require_POST, require_safe
+from .api import api_login_required, json_response
+from .counters import applications_status_changed, status_field
+from .events import publish_status_change, publish_status_changes
+from .facets import apply_facet_filters, get_facet_counts, get_facet_filters
+from .metrics import exposition
+from .notifications import get_unread_count, mark_read
+from .pagination import keyset_page
+from .profiles import invalidate_profile_sections, load_seeker_profile
+from .recommendations import top_recommendations
+from .search import get_search_backend
+from .tasks import enqueue
 
 def register(request):
     if request.method == 'POST':
@@ -50,7 +74,7 @@ def seeker_profile(request):
         messages.error(request, "Access denied.")
         return redirect('dashboard')
 
-    seeker, created = JobSeekerProfile.objects.get_or_create(user=request.user)
+    seeker, profile_sections = load_seeker_profile(request.user)
 
     form = JobSeekerProfileForm(request.POST or None, request.FILES or None, instance=seeker)
     if request.method == 'POST' and form.is_valid():
@@ -60,10 +84,7 @@ def seeker_profile(request):
 
     context = {
         'form': form,
-        'experiences': Experience.objects.filter(seeker=seeker),
-        'educations': Education.objects.filter(seeker=seeker),
-        'certifications': Certification.objects.filter(seeker=seeker),
-        'portfolios': Portfolio.objects.filter(seeker=seeker),
+        'profile_sections': profile_sections,
     }
     return render(request, 'core/seeker_profile.html', context)
 
@@ -111,7 +132,8 @@ def post_job(request):
         if form.is_valid():
             job = form.save(commit=False)
             job.employer = employer
-            job.save()
+            with transaction.atomic():
+                job.save()
             messages.success(request, "Job posted successfully!")
             return redirect('my-jobs')
     else:
@@ -136,7 +158,8 @@ def edit_job(request, job_id):
     if request.method == 'POST':
         form = JobForm(request.POST, instance=job)
         if form.is_valid():
-            form.save()
+            with transaction.atomic():
+                form.save()
             messages.success(request, 'Job updated successfully.')
             return redirect('my-jobs')
     else:
@@ -150,18 +173,74 @@ def delete_job(request, job_id):
     job = get_object_or_404(Job, id=job_id, employer=request.user.employerprofile)
 
     if request.method == 'POST':
-        job.delete()
+        with transaction.atomic():
+            applicant_user_ids = list(Application.objects.filter(job=job).values_list('seeker__user_id', flat=True))
+            job.delete()
+            if applicant_user_ids:
+                enqueue('notify_users', user_ids=applicant_user_ids, message=f"The job {job.title} has been closed.")
         messages.success(request, 'Job deleted successfully.')
         return redirect('my-jobs')
     
     return render(request, 'core/delete_job.html', {'job': job})
 
-@login_required
-def job_list(request):
-    jobs = Job.objects.filter(is_active=True).order_by('-created_at')
+def _query_string(params, **updates):
+    params = params.copy()
+    params.pop('cursor', None)
+    for key, value in updates.items():
+        if value is None:
+            params.pop(key, None)
+        else:
+            params[key] = value
+    return params.urlencode()
+
+
+def _job_listing(request):
+    """The active jobs matching the search box, their ordering and the facet selection."""
+    jobs = Job.objects.live()
+    ordering = ('-created_at', '-id')
     query = request.GET.get('q')
     if query:
-        jobs = jobs.filter(title__icontains=query)
+        jobs = get_search_backend().search(jobs, query)
+        ordering = ('-search_rank', '-id')
+    return jobs, ordering, get_facet_filters(request.GET)
+
+
+def _job_list_context(request, page, facet_counts, filters, applied_ids, saved_job_ids):
+    facets = {
+        facet: [
+            {
+                'value': value,
+                'label': label,
+                'count': count,
+                'selected': filters.get(facet) == value,
+                'query_string': _query_string(request.GET, **{facet: None if filters.get(facet) == value else value}),
+            }
+            for value, label, count in options
+        ]
+        for facet, options in facet_counts.items()
+    }
+    next_query_string = None
+    if page.has_next:
+        next_params = request.GET.copy()
+        next_params['cursor'] = page.next_cursor
+        next_query_string = next_params.urlencode()
+
+    return {
+        'jobs': page,
+        'applied_ids': applied_ids,
+        'saved_job_ids': saved_job_ids,
+        'query': request.GET.get('q'),
+        'facets': facets,
+        'first_query_string': _query_string(request.GET) if request.GET.get('cursor') else None,
+        'next_query_string': next_query_string,
+    }
+
+
+@login_required
+def job_list(request):
+    jobs, ordering, filters = _job_listing(request)
+    facet_counts = get_facet_counts(jobs, filters)
+    page = keyset_page(apply_facet_filters(jobs, filters), ordering, cursor=request.GET.get('cursor'))
 
     applied_ids = set()
     saved_job_ids = set()
@@ -171,12 +250,9 @@ def job_list(request):
         applied_ids = set(Application.objects.filter(seeker=seeker).values_list('job_id', flat=True))
         saved_job_ids = set(SavedJob.objects.filter(seeker=seeker).values_list('job_id', flat=True))
 
-    return render(request, 'core/job_list.html', {
-        'jobs': jobs,
-        'applied_ids': applied_ids,
-        'saved_job_ids': saved_job_ids,
-        'query': query,
-    })
+    return render(request, 'core/job_list.html', _job_list_context(
+        request, page, facet_counts, filters, applied_ids, saved_job_ids,
+    ))
     
 @login_required
 def apply_job(request, job_id):
@@ -184,24 +260,35 @@ def apply_job(request, job_id):
         messages.error(request, "Access denied.")
         return redirect('dashboard')
 
-    job = get_object_or_404(Job, id=job_id, is_active=True)
+    job = get_object_or_404(Job.objects.live(), id=job_id)
     seeker_profile = request.user.jobseekerprofile
 
-    if Application.objects.filter(job=job, seeker=seeker_profile).exists():
-        messages.warning(request, "You've already applied to this job.")
-        return redirect('job-list')
-
     if request.method == 'POST':
-        cover_letter = request.POST.get('cover_letter')
-        Application.objects.create(
-            job=job,
-            seeker=seeker_profile,
-            resume=seeker_profile.resume,
-            cover_letter=cover_letter,
-        )
+        cover_letter = request.POST.get('cover_letter', '')
+        # The (seeker, job) unique constraint catches repeat submissions, so no
+        # separate existence check is needed and concurrent ones can't slip through.
+        try:
+            with transaction.atomic():
+                application = Application.objects.create(
+                    job=job,
+                    seeker=seeker_profile,
+                    resume=seeker_profile.resume,
+                    cover_letter=cover_letter,
+                )
+                enqueue('application_submitted', key=f'application-submitted:{application.pk}', application_id=application.pk)
+        except IntegrityError:
+            # Anything but the unique constraint is a real error.
+            if not Application.objects.filter(job=job, seeker=seeker_profile).exists():
+                raise
+            messages.warning(request, "You've already applied to this job.")
+            return redirect('job-list')
         messages.success(request, "Application submitted!")
         return redirect('job-list')
 
+    if Application.objects.filter(job=job, seeker=seeker_profile).exists():
+        messages.warning(request, "You've already applied to this job.")
+        return redirect('job-list')
+
     return render(request, 'core/apply_job.html', {'job': job})
 
 
@@ -211,30 +298,25 @@ def seeker_dashboard(request):
         return redirect('dashboard')
 
     seeker = request.user.jobseekerprofile
-    seeker_skills = set(seeker.skills.values_list('name', flat=True))
-    jobs = Job.objects.filter(is_active=True).order_by('-created_at')
+    jobs = Job.objects.live().order_by('-created_at')
 
     applied_ids = set(Application.objects.filter(seeker=seeker).values_list('job_id', flat=True))
     saved_jobs = SavedJob.objects.filter(seeker=seeker).select_related('job')
     saved_job_ids = set(saved_jobs.values_list('job__id', flat=True))  # ✅ prepare for template
 
-    # Build recommended
-    recommended = []
-    for job in jobs:
-        job_skills = set(map(str.strip, job.skills_required.lower().split(',')))
-        matched = seeker_skills.intersection(job_skills)
-        score = round((len(matched) / len(job_skills) * 100), 1) if job_skills else 0
-        if score > 0:
-            recommended.append((job, score))
+    recommended = top_recommendations(seeker)
 
     return render(request, 'core/seeker_dashboard.html', {
-    'recommended_jobs': recommended[:5],
+    'recommended_jobs': recommended,
     'all_jobs': jobs[:5],
     'applied_ids': applied_ids,
     'saved_jobs': saved_jobs,
     'saved_job_ids': saved_job_ids,  # ✅ added
     })
 
+DASHBOARD_VISIT_WINDOW = datetime.timedelta(minutes=30)
+
+
 @login_required
 def employer_dashboard(request):
     if request.user.role != 'employer':
@@ -242,18 +324,67 @@ def employer_dashboard(request):
         return redirect('dashboard')
 
     employer_profile = request.user.employerprofile
-    jobs = Job.objects.filter(employer=employer_profile)
+
+    # The previous visit is kept in the session, which is loaded anyway. It is
+    # only moved on once it is DASHBOARD_VISIT_WINDOW old, so reloads don't
+    # each cost a session write (and keep showing the same "new" counts).
+    now = timezone.now()
+    last_visit = parse_datetime(request.session.get('employer_dashboard_last_visit', ''))
+    if last_visit is None or now - last_visit >= DASHBOARD_VISIT_WINDOW:
+        request.session['employer_dashboard_last_visit'] = now.isoformat()
+    last_visit = last_visit or now
+
+    # Totals and per-status counts come from the counters on Job; only the
+    # "new since last visit" figure still needs an aggregate.
+    statuses = Application._meta.get_field('status').choices
+    jobs = Job.objects.filter(employer=employer_profile).annotate(
+        new_count=Count('application', filter=Q(application__applied_at__gt=last_visit)),
+    ).order_by('-created_at')
 
     job_data = []
     for job in jobs:
-        applicants = Application.objects.filter(job=job)
         job_data.append({
             'job': job,
-            'applicant_count': applicants.count()
+            'applicant_count': job.application_count,
+            'new_count': job.new_count,
+            'status_counts': [(label, getattr(job, status_field(status))) for status, label in statuses],
         })
 
     return render(request, 'core/employer_dashboard.html', {'job_data': job_data})
 
+# Statuses in hiring pipeline order, for the "By status" sort.
+STATUS_PIPELINE = ('applied', 'interview', 'hired', 'rejected')
+STATUS_RANK = Case(
+    *[When(status=status, then=Value(rank)) for rank, status in enumerate(STATUS_PIPELINE)],
+    default=Value(len(STATUS_PIPELINE)),
+    output_field=IntegerField(),
+)
+
+APPLICANT_SORTS = {
+    'newest': ("Newest first", ('-applied_at', '-id')),
+    'oldest': ("Oldest first", ('applied_at', 'id')),
+    'status': ("By status", ('status_rank', 'applied_at', 'id')),
+}
+
+
+def _applicant_filters(params):
+    """The status and applied-date filters in ``params``; unknown or malformed values are ignored."""
+    filters = {}
+    status = params.get('status')
+    if status in dict(Application._meta.get_field('status').choices):
+        filters['status'] = status
+    # Whole local days, as bounds on applied_at itself so the (job, applied_at) indexes apply.
+    for param, lookup, offset in (('applied_from', 'applied_at__gte', 0), ('applied_to', 'applied_at__lt', 1)):
+        try:
+            day = parse_date(params.get(param, ''))
+        except ValueError:
+            day = None
+        if day is not None:
+            start = datetime.datetime.combine(day + datetime.timedelta(days=offset), datetime.time.min)
+            filters[lookup] = timezone.make_aware(start)
+    return filters
+
+
 @login_required
 def view_applicants(request, job_id):
     if request.user.role != 'employer':
@@ -261,12 +392,156 @@ def view_applicants(request, job_id):
         return redirect('dashboard')
 
     job = get_object_or_404(Job, id=job_id, employer=request.user.employerprofile)
-    applications = Application.objects.filter(job=job).select_related('seeker__user')
+    sort = request.GET.get('sort') if request.GET.get('sort') in APPLICANT_SORTS else 'newest'
+    applications = (
+        Application.objects.filter(job=job, **_applicant_filters(request.GET))
+        .select_related('seeker__user')
+        # Cover letters and bios can be long; the letter is fetched on demand from applicant_cover_letter.
+        .defer('cover_letter', 'seeker__bio')
+        .annotate(
+            has_cover_letter=ExpressionWrapper(~Q(cover_letter=''), output_field=BooleanField()),
+            status_rank=STATUS_RANK,
+        )
+    )
+    page = keyset_page(applications, APPLICANT_SORTS[sort][1], cursor=request.GET.get('cursor'))
+
+    next_query_string = None
+    if page.has_next:
+        next_params = request.GET.copy()
+        next_params['cursor'] = page.next_cursor
+        next_query_string = next_params.urlencode()
 
+    statuses = Application._meta.get_field('status').choices
     return render(request, 'core/view_applicants.html', {
         'job': job,
-        'applications': applications
+        'applications': page,
+        'status_choices': [(status, label, getattr(job, status_field(status))) for status, label in statuses],
+        'sorts': [(key, label) for key, (label, ordering) in APPLICANT_SORTS.items()],
+        'selected': {
+            'status': request.GET.get('status', ''),
+            'sort': sort,
+            'applied_from': request.GET.get('applied_from', ''),
+            'applied_to': request.GET.get('applied_to', ''),
+        },
+        'current_query_string': request.GET.urlencode(),
+        'first_query_string': _query_string(request.GET) if request.GET.get('cursor') else None,
+        'next_query_string': next_query_string,
     })
+
+
+def _back_to_applicants(request, job_id):
+    """Redirect to the applicants page with the filters, sort and page the form was posted from."""
+    response = redirect('view-applicants', job_id=job_id)
+    query = QueryDict(request.POST.get('return_query', '')).urlencode()
+    if query:
+        response['Location'] += f'?{query}'
+    return response
+
+
+@login_required
+@require_safe
+def applicant_cover_letter(request, application_id):
+    """HTML fragment with one application's cover letter, loaded into the applicants page on demand."""
+    if request.user.role != 'employer':
+        return HttpResponseForbidden()
+    app = get_object_or_404(
+        Application.objects.only('cover_letter'),
+        id=application_id, job__employer=request.user.employerprofile,
+    )
+    return render(request, 'core/cover_letter.html', {'cover_letter': app.cover_letter})
+
+
+EXPORT_FIELDS = (
+    'application_id', 'username', 'email', 'phone', 'location', 'skills',
+    'status', 'applied_at', 'resume', 'cover_letter',
+)
+EXPORT_CHUNK_SIZE = 1000
+
+
+class _Echo:
+    """A write-only file whose write() returns its input, so csv.writer can produce lines for a stream."""
+
+    def write(self, value):
+        return value
+
+
+def _applicant_rows(request, job):
+    applications = (
+        Application.objects.filter(job=job)
+        .select_related('seeker__user')
+        .prefetch_related('seeker__skills')
+        .order_by('id')
+    )
+    # iterator() reads (and prefetches skills for) one chunk at a time.
+    for app in applications.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        seeker = app.seeker
+        yield {
+            'application_id': app.pk,
+            'username': seeker.user.username,
+            'email': seeker.user.email,
+            'phone': seeker.phone,
+            'location': seeker.location,
+            'skills': ', '.join(sorted(skill.name for skill in seeker.skills.all())),
+            'status': app.status,
+            'applied_at': app.applied_at.isoformat(),
+            'resume': request.build_absolute_uri(app.resume.url) if app.resume else '',
+            'cover_letter': app.cover_letter,
+        }
+
+
+# Leading characters that make a spreadsheet read a cell as a formula.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# Signed numbers such as phone numbers (+1 555 0100): at worst arithmetic, so left as they are.
+PLAIN_NUMBER = re.compile(r'[+-][\d\s().-]+')
+
+
+def _csv_cell(value):
+    """``value`` with a leading quote if a spreadsheet would run it as a formula; applicants control most cells."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES) and not PLAIN_NUMBER.fullmatch(value):
+        return f"'{value}"
+    return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([_csv_cell(row[field]) for field in EXPORT_FIELDS])
+
+
+def _jsonl_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+async def _in_batches(lines, size=EXPORT_CHUNK_SIZE):
+    # The sync generator holds a database cursor, so it is always advanced on the same (thread-sensitive) thread.
+    take = sync_to_async(lambda: ''.join(islice(lines, size)))
+    while chunk := await take():
+        yield chunk
+
+
+@login_required
+def export_applicants(request, job_id):
+    """Stream every applicant of a job as CSV or JSON Lines (?format=jsonl) in constant memory."""
+    if request.user.role != 'employer':
+        messages.error(request, "Access denied.")
+        return redirect('dashboard')
+
+    job = get_object_or_404(Job, id=job_id, employer=request.user.employerprofile)
+    export_format = request.GET.get('format', 'csv')
+    if export_format == 'csv':
+        lines, content_type = _csv_lines(_applicant_rows(request, job)), 'text/csv'
+    elif export_format == 'jsonl':
+        lines, content_type = _jsonl_lines(_applicant_rows(request, job)), 'application/x-ndjson'
+    else:
+        return HttpResponseBadRequest("format must be csv or jsonl.")
+
+    # Under ASGI a sync iterator would be read into memory before sending.
+    content = _in_batches(lines) if isinstance(request, ASGIRequest) else lines
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="job-{job.pk}-applicants.{export_format}"'
+    return response
     
 @require_POST
 @login_required
@@ -275,18 +550,78 @@ def update_applicant_status(request, application_id):
         messages.error(request, "Access denied.")
         return redirect('dashboard')
 
-    app = get_object_or_404(Application, id=application_id)
-    if app.job.employer != request.user.employerprofile:
+    app = get_object_or_404(Application.objects.select_related('job__employer', 'seeker'), id=application_id)
+    if app.job.employer.user_id != request.user.pk:
         messages.error(request, "You are not authorized.")
         return redirect('employer-dashboard')
 
     new_status = request.POST.get('status')
     if new_status in dict(Application._meta.get_field('status').choices):
+        # Only move the counters if this request is the one that changed the row.
+        old_status = app.status
         app.status = new_status
-        app.save()
+        with transaction.atomic():
+            if Application.objects.filter(pk=app.pk, status=old_status).update(status=new_status):
+                applications_status_changed(app.job_id, {old_status: 1}, new_status)
+                enqueue('application_status_changed', application_id=app.pk, status=new_status)
+                publish_status_change(app, app.job)
         messages.success(request, f"Status updated to {new_status.capitalize()}.")
 
-    return redirect('view-applicants', job_id=app.job.id)
+    return _back_to_applicants(request, app.job_id)
+
+
+def _change_statuses(job, application_ids, new_status):
+    """
+    Move the given applications of ``job`` to ``new_status`` and return the ones that changed.
+
+    Runs one UPDATE per previous status, so the counters move by exactly the
+    rows each UPDATE changed, then queues one notification task and publishes
+    all the events once the transaction commits.
+    """
+    with transaction.atomic():
+        # Lock the applications only; the joined seeker profiles stay editable.
+        applications = list(
+            Application.objects.filter(job=job, id__in=application_ids).exclude(status=new_status)
+            .select_related('seeker').only('status', 'seeker__user').select_for_update(of=('self',))
+        )
+        by_status = {}
+        for app in applications:
+            by_status.setdefault(app.status, []).append(app)
+
+        old_statuses = {}
+        for old_status, apps in by_status.items():
+            old_statuses[old_status] = Application.objects.filter(
+                id__in=[app.pk for app in apps], status=old_status,
+            ).update(status=new_status)
+        if not applications:
+            return []
+
+        applications_status_changed(job.pk, old_statuses, new_status)
+        for app in applications:
+            app.status = new_status
+        enqueue('applications_status_changed', application_ids=[app.pk for app in applications], status=new_status)
+        publish_status_changes(applications, job)
+    return applications
+
+
+@require_POST
+@login_required
+def bulk_update_applicant_status(request, job_id):
+    if request.user.role != 'employer':
+        messages.error(request, "Access denied.")
+        return redirect('dashboard')
+
+    job = get_object_or_404(Job, id=job_id, employer__user=request.user)
+    statuses = dict(Application._meta.get_field('status').choices)
+    new_status = request.POST.get('status')
+    application_ids = {int(value) for value in request.POST.getlist('application_ids') if value.isdigit()}
+    if new_status not in statuses or not application_ids:
+        messages.error(request, "Select applicants and a status.")
+        return _back_to_applicants(request, job.pk)
+
+    changed = _change_statuses(job, application_ids, new_status)
+    messages.success(request, f"{len(changed)} applicant(s) moved to {statuses[new_status]}.")
+    return _back_to_applicants(request, job.pk)
 
 @login_required
 def add_experience(request):
@@ -298,6 +633,7 @@ def add_experience(request):
         exp = form.save(commit=False)
         exp.seeker = seeker
         exp.save()
+        invalidate_profile_sections(seeker.pk)
         messages.success(request, "Experience added.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Add Experience'})
@@ -313,6 +649,7 @@ def add_education(request):
         edu = form.save(commit=False)
         edu.seeker = seeker
         edu.save()
+        invalidate_profile_sections(seeker.pk)
         messages.success(request, "Education added.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Add Education'})
@@ -328,6 +665,7 @@ def add_certification(request):
         cert = form.save(commit=False)
         cert.seeker = seeker
         cert.save()
+        invalidate_profile_sections(seeker.pk)
         messages.success(request, "Certification added.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Add Certification'})
@@ -343,6 +681,7 @@ def add_portfolio(request):
         project = form.save(commit=False)
         project.seeker = seeker
         project.save()
+        invalidate_profile_sections(seeker.pk)
         messages.success(request, "Portfolio project added.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Add Portfolio'})
@@ -353,6 +692,7 @@ def edit_experience(request, pk):
     form = ExperienceForm(request.POST or None, instance=exp)
     if form.is_valid():
         form.save()
+        invalidate_profile_sections(exp.seeker_id)
         messages.success(request, "Experience updated.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Edit Experience'})
@@ -361,6 +701,7 @@ def edit_experience(request, pk):
 def delete_experience(request, pk):
     exp = get_object_or_404(Experience, id=pk, seeker=request.user.jobseekerprofile)
     exp.delete()
+    invalidate_profile_sections(exp.seeker_id)
     messages.success(request, "Experience deleted.")
     return redirect('seeker-profile')
 
@@ -370,6 +711,7 @@ def edit_education(request, pk):
     form = EducationForm(request.POST or None, instance=edu)
     if form.is_valid():
         form.save()
+        invalidate_profile_sections(edu.seeker_id)
         messages.success(request, "Education updated.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Edit Education'})
@@ -378,6 +720,7 @@ def edit_education(request, pk):
 def delete_education(request, pk):
     edu = get_object_or_404(Education, id=pk, seeker=request.user.jobseekerprofile)
     edu.delete()
+    invalidate_profile_sections(edu.seeker_id)
     messages.success(request, "Education deleted.")
     return redirect('seeker-profile')
 
@@ -387,6 +730,7 @@ def edit_certification(request, pk):
     form = CertificationForm(request.POST or None, instance=cert)
     if form.is_valid():
         form.save()
+        invalidate_profile_sections(cert.seeker_id)
         messages.success(request, "Certification updated.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Edit Certification'})
@@ -395,6 +739,7 @@ def edit_certification(request, pk):
 def delete_certification(request, pk):
     cert = get_object_or_404(Certification, id=pk, seeker=request.user.jobseekerprofile)
     cert.delete()
+    invalidate_profile_sections(cert.seeker_id)
     messages.success(request, "Certification deleted.")
     return redirect('seeker-profile')
 
@@ -404,6 +749,7 @@ def edit_portfolio(request, pk):
     form = PortfolioForm(request.POST or None, instance=portfolio)
     if form.is_valid():
         form.save()
+        invalidate_profile_sections(portfolio.seeker_id)
         messages.success(request, "Portfolio project updated.")
         return redirect('seeker-profile')
     return render(request, 'core/form_page.html', {'form': form, 'title': 'Edit Portfolio'})
@@ -412,6 +758,7 @@ def edit_portfolio(request, pk):
 def delete_portfolio(request, pk):
     portfolio = get_object_or_404(Portfolio, id=pk, seeker=request.user.jobseekerprofile)
     portfolio.delete()
+    invalidate_profile_sections(portfolio.seeker_id)
     messages.success(request, "Portfolio project deleted.")
     return redirect('seeker-profile')
 
@@ -484,4 +831,31 @@ def payment_history(request):
         return redirect('dashboard')
 
     payments = Payment.objects.filter(employer=request.user.employerprofile).order_by('-timestamp')
-    return render(request, 'core/payment_history.html', {'payments': payments})
\ No newline at end of file
+    return render(request, 'core/payment_history.html', {'payments': payments})
+
+
+@login_required
+def notification_list(request):
+    notifications = Notification.objects.filter(user=request.user).order_by('-created_at', '-id')[:50]
+    return render(request, 'core/notifications.html', {'notifications': notifications})
+
+
+@require_POST
+@login_required
+def mark_notifications_read(request):
+    mark_read(request.user)
+    return redirect('notifications')
+
+
+@api_login_required
+@require_safe
+def unread_notification_count(request):
+    return json_response({'unread': get_unread_count(request.user.pk)})
+
+
+@require_safe
+def prometheus_metrics(request):
+    """Request metrics collected by MetricsMiddleware, for staff and scrapers logged in as staff."""
+    if not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(exposition(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -46,6 +46,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.NPlusOneMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -87,6 +89,63 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Cached fragments are invalidated explicitly, so deployments running more than
+# one process need a shared backend (Redis or Memcached) here. Unread
+# notification counts are written by the task worker, so they are only cached
+# with a shared backend; with this local one every read counts in the database.
+# Profile sections are kept for a minute instead of a day with a local backend.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+
+# Email
+# https://docs.djangoproject.com/en/4.2/topics/email/
+
+EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+DEFAULT_FROM_EMAIL = "Job Portal <noreply@localhost>"
+
+
+# Background tasks (core.tasks)
+# Run `python manage.py run_worker` to process the queue. With TASK_QUEUE_EAGER
+# set, tasks run inline in the request instead.
+
+TASK_QUEUE_EAGER = False
+
+
+# Concurrent queries of the async views (core.concurrency). Each pool thread
+# keeps one database connection open per database.
+
+QUERY_POOL_SIZE = 4
+
+
+# Live events (core.events)
+# The in-process broker only reaches streams served by the same process. Point
+# this at a core.events.BaseBroker subclass to share events between workers.
+
+EVENT_BROKER = 'core.events.InProcessBroker'
+
+
+# Request metrics (core.metrics), served to staff at /metrics/.
+# When disabled the middleware removes itself at startup.
+
+METRICS_ENABLED = False
+METRICS_SAMPLE_RATE = 1.0  # share of requests measured
+
+
+# N+1 query detection (core.nplusone). Repeated query shapes are logged, or
+# raised as errors with NPLUSONE_RAISE (use it for test runs).
+
+NPLUSONE_ENABLED = DEBUG
+NPLUSONE_RAISE = False
+NPLUSONE_THRESHOLD = 3  # runs of one query shape per request that count as N+1
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 